@@ -1,4 +1,10 @@
 # -*- mode: python ; coding: utf-8 -*-
+import sys
+sys.path.insert(0, 'src')
+from core.data_bundle import build_bundle
+
+# Ship the precompiled static data (src/data/static_data.bundle) with the JSON files
+build_bundle()
 
 
 a = Analysis(
@@ -0,0 +1,152 @@
+"""
+Benchmark suite for LogicEngine.
+
+Generates synthetic locations_logic.json-shaped files (100 .. 100k locations,
+varying rule widths) and times calculate_accessibility, get_missing_requirements
+and determine_color. Results are written as JSON so runs can be compared.
+
+Usage (from the src directory):
+    python benchmark_logic.py --output bench_results.json
+    python benchmark_logic.py --sizes 100 1000 --widths 2 --repeat 3
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from core.data_loader import DataLoader
+from core.logic_engine import LogicEngine
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+DEFAULT_WIDTHS = [1, 3, 6]
+ITEM_POOL_SIZE = 48
+ALTERNATIVES = (1, 3) # min/max OR-alternatives per location
+
+
+def generate_logic(size, width, seed=0):
+    """Returns (locations_logic, cities) dicts shaped like the real data files."""
+    rng = random.Random(seed)
+    items = [f"Item{i}" for i in range(ITEM_POOL_SIZE)]
+
+    logic = {}
+    for index in range(size):
+        rules = [
+            ",".join(rng.sample(items, width))
+            for _ in range(rng.randint(*ALTERNATIVES))
+        ]
+        logic[f"Location {index}"] = {"access_rules": rules}
+
+    # Every 20th location is a city, a few of them without logic (default accessible)
+    cities = {f"Location {index}": [0.0, 0.0] for index in range(0, size, 20)}
+    cities.update({f"City {index}": [0.0, 0.0] for index in range(size // 100)})
+    return logic, cities
+
+
+def random_inventories(count, seed=1):
+    rng = random.Random(seed)
+    return [
+        {f"Item{i}": rng.random() < 0.5 for i in range(ITEM_POOL_SIZE)}
+        for _ in range(count)
+    ]
+
+
+def _best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_case(data_dir, size, width, repeat):
+    logic, cities = generate_logic(size, width)
+    (data_dir / "locations_logic.json").write_text(json.dumps(logic), encoding="utf-8")
+    (data_dir / "cities.json").write_text(json.dumps(cities), encoding="utf-8")
+
+    start = time.perf_counter()
+    engine = LogicEngine(DataLoader(data_dir))
+    compile_time = time.perf_counter() - start
+
+    inventories = random_inventories(repeat)
+    locations = list(engine.location_names)
+
+    # Cold: every call sees a new inventory fingerprint (no memo hits)
+    engine.clear_cache()
+    cold_iter = iter(inventories)
+    accessibility_cold = _best_of(repeat, lambda: engine.calculate_accessibility(next(cold_iter)))
+
+    # Warm: same inventory again, served from the memo
+    accessibility_warm = _best_of(repeat, lambda: engine.calculate_accessibility(inventories[0]))
+
+    accessibility = engine.calculate_accessibility(inventories[0])
+    missing_iter = iter(inventories)
+
+    def missing_pass():
+        engine.clear_cache()
+        inventory = next(missing_iter)
+        for location in locations:
+            engine.get_missing_requirements(location, inventory)
+
+    missing_requirements = _best_of(repeat, missing_pass)
+
+    def color_pass():
+        for location in locations:
+            engine.determine_color(location, accessibility[location], False)
+
+    determine_color = _best_of(repeat, color_pass)
+
+    return {
+        "locations": len(locations),
+        "rule_width": width,
+        "items": len(engine.item_names),
+        "compile_s": compile_time,
+        "calculate_accessibility_cold_s": accessibility_cold,
+        "calculate_accessibility_warm_s": accessibility_warm,
+        "get_missing_requirements_all_s": missing_requirements,
+        "determine_color_all_s": determine_color,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LogicEngine benchmark on synthetic logic files.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--widths", type=int, nargs="+", default=DEFAULT_WIDTHS)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is kept).")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout.")
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        for size in args.sizes:
+            for width in args.widths:
+                case = run_case(data_dir, size, width, args.repeat)
+                results.append(case)
+                print(
+                    f"{size:>7} locations, width {width}: "
+                    f"accessibility {case['calculate_accessibility_cold_s'] * 1000:.2f} ms, "
+                    f"missing {case['get_missing_requirements_all_s'] * 1000:.2f} ms, "
+                    f"color {case['determine_color_all_s'] * 1000:.2f} ms",
+                    file=sys.stderr
+                )
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Precompiled static-data bundle.
+
+Every static JSON file of the data directory (all but MUTABLE_DATA_FILES),
+already parsed and validated, in one pickle:
+    {"format": BUNDLE_FORMAT, "hash": data_hash(...),
+     "sources": source_stats(...), "files": {filename: data}}
+The core.models views are not stored: building them from the parsed data
+is faster than unpickling thousands of slotted instances.
+
+Build it (from the src directory, also done by the PyInstaller spec):
+    python -m core.data_bundle [--data-dir DIR]
+
+DataLoader reads it in a single read at startup. The JSON files next to it
+are only stat()ed: when their mtimes and sizes match the stored ones no JSON
+file is opened. Otherwise they are hashed: unchanged content (touch, fresh
+checkout) refreshes the stored stats, changed content (edited data, stale
+bundle) makes the loader ignore the bundle and parse the JSON files as before.
+Frozen builds ship bundle and data together and skip the check.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from core.models import MODEL_PARSERS, DataValidationError
+from core.persistence import atomic_write_bytes
+from utils.constants import DATA_DIR, DATA_BUNDLE_NAME, MUTABLE_DATA_FILES
+
+# Bump when the bundle layout changes
+BUNDLE_FORMAT = 3
+
+
+def static_data_files(data_dir) -> List[Path]:
+    """Static JSON files of a data directory, sorted by name."""
+    return sorted(
+        path for path in Path(data_dir).glob("*.json")
+        if path.name not in MUTABLE_DATA_FILES
+    )
+
+
+def source_stats(data_dir) -> Dict[str, Tuple[int, int]]:
+    """{filename: (st_mtime_ns, st_size)} of the static JSON files (cheap freshness check)."""
+    stats = {}
+    for path in static_data_files(data_dir):
+        stat = path.stat()
+        stats[path.name] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+def data_hash(data_dir) -> str:
+    """Content hash over the names and raw bytes of the static JSON files (no parsing)."""
+    digest = hashlib.sha256()
+    for path in static_data_files(data_dir):
+        digest.update(path.name.encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def build_bundle(data_dir=None, path=None) -> Path:
+    """Parses every static JSON file and writes the bundle (atomically)."""
+    data_dir = Path(data_dir) if data_dir else DATA_DIR
+    path = Path(path) if path else data_dir / DATA_BUNDLE_NAME
+
+    sources = source_stats(data_dir)
+    content_hash = data_hash(data_dir)
+    files = {}
+    for file_path in static_data_files(data_dir):
+        filename = file_path.name
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            parser = MODEL_PARSERS.get(filename)
+            if parser is not None:
+                parser(data) # Validation only
+        except (json.JSONDecodeError, DataValidationError) as e:
+            # Left out: DataLoader reports it (and falls back to {}) as without a bundle
+            logging.error(f"Data bundle: skipping {filename}: {e}")
+            continue
+        files[filename] = data
+
+    bundle = {
+        "format": BUNDLE_FORMAT, "hash": content_hash, "sources": sources,
+        "files": files,
+    }
+    atomic_write_bytes(path, pickle.dumps(bundle, protocol=pickle.HIGHEST_PROTOCOL))
+    logging.info(f"Data bundle: wrote {len(files)} files to {path}.")
+    return path
+
+
+def load_bundle(data_dir=None, path=None) -> Optional[Dict[str, Any]]:
+    """
+    Returns the bundle ({"files": ..., "mtimes": ...}), or None
+    when it is missing, unreadable, of another format or out of date with the
+    JSON files. "mtimes" holds the current st_mtime_ns of the sources (hot reload).
+    """
+    data_dir = Path(data_dir) if data_dir else DATA_DIR
+    path = Path(path) if path else data_dir / DATA_BUNDLE_NAME
+    if not path.exists():
+        return None
+
+    try:
+        bundle = pickle.loads(path.read_bytes())
+    except Exception as e:
+        logging.warning(f"Data bundle: unreadable ({e}), using JSON files.")
+        return None
+
+    if not isinstance(bundle, dict) or bundle.get("format") != BUNDLE_FORMAT:
+        logging.warning("Data bundle: unknown format, using JSON files.")
+        return None
+
+    if getattr(sys, 'frozen', False):
+        # Built together with the data it was compiled from
+        bundle["mtimes"] = {}
+        return bundle
+
+    sources = source_stats(data_dir)
+    # A bundle shipped without its JSON sources is trusted as is. Touched but
+    # unchanged files (e.g. a fresh checkout) pass the hash check.
+    if sources and sources != bundle.get("sources"):
+        if bundle.get("hash") != data_hash(data_dir):
+            logging.warning("Data bundle: out of date with the JSON files, using JSON files.")
+            return None
+        # Same content: store the new stats so the next start skips the hash again
+        bundle["sources"] = sources
+        try:
+            atomic_write_bytes(path, pickle.dumps(bundle, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError as e:
+            logging.warning(f"Data bundle: could not refresh the stored file stats ({e}).")
+
+    bundle["mtimes"] = {name: stat[0] for name, stat in sources.items()}
+    return bundle
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the static data files into one bundle.")
+    parser.add_argument("--data-dir", help="Data directory (default: src/data)")
+    parser.add_argument("--output", help=f"Bundle path (default: <data dir>/{DATA_BUNDLE_NAME})")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
+    build_bundle(args.data_dir, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,51 +1,194 @@
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any
-from utils.constants import DATA_DIR, IMAGES_DIR
+from typing import Dict, Any, FrozenSet, Iterable, Optional, Tuple
+from core.data_bundle import load_bundle
+from core.models import MODEL_PARSERS, DataValidationError, Location, City, Character, Item, ShopEntry
+from utils.constants import APP_DATA_FILES, DATA_DIR, IMAGES_DIR
 
 class DataLoader:
     """
     Handles loading of static data (JSONs) and resources.
     Caches data to avoid redundant IO.
+    Starts from the precompiled bundle (core.data_bundle) when it matches
+    the JSON files, so most loads never touch the disk.
+    Files with a model (core.models) are validated once when read and only
+    kept as their typed views (get_*_models); a bad entry is logged and
+    skipped, the rest of the file stays usable.
     """
     
-    def __init__(self):
-        self._cache: Dict[str, Any] = {}
+    def __init__(self, data_dir=None, use_bundle=True):
+        # data_dir lets tools point the loader at alternative data (e.g. benchmarks)
+        self._data_dir = Path(data_dir) if data_dir else DATA_DIR
+        self._cache: Dict[str, Any] = {} # filename -> parsed JSON (files without a model, bundled files until first use)
+        self._mtimes: Dict[str, int] = {} # filename -> st_mtime_ns of the cached data (hot reload)
+        self._models: Dict[str, Any] = {} # filename -> core.models view
+        if use_bundle:
+            bundle = load_bundle(self._data_dir)
+            if bundle is not None:
+                bundled = bundle["files"]
+                self._cache.update(bundled)
+                # Sources just checked against the bundle (none: nothing to watch)
+                mtimes = bundle["mtimes"]
+                self._mtimes.update((name, mtimes[name]) for name in bundled if name in mtimes)
+                logging.info(f"DataLoader: {len(bundled)} files from the data bundle.")
+
+    def _read(self, filename: str):
+        """(parsed JSON, st_mtime_ns) of a data file. Raises OSError / JSONDecodeError."""
+        path = self._data_dir / filename
+        mtime = path.stat().st_mtime_ns # Before reading: a concurrent edit is picked up by the next poll
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f), mtime
+
+    def _parse_models(self, filename: str, data):
+        """Model view of `data`, bad entries logged and skipped (raises DataValidationError for a bad root)."""
+        errors = []
+        models = MODEL_PARSERS[filename](data, errors=errors)
+        for error in errors:
+            logging.error(f"Invalid data, entry skipped: {error}")
+        return models
+
+    def _load(self, filename: str):
+        """
+        Reads a file into the cache: the model view when it has one, the JSON
+        otherwise. A file that cannot be used is cached empty (logged once)
+        and retried by reload_changed after its next modification.
+        """
+        has_models = filename in MODEL_PARSERS
+        try:
+            data, mtime = self._read(filename)
+            result = self._parse_models(filename, data) if has_models else data
+        except FileNotFoundError:
+            logging.error(f"File not found: {self._data_dir / filename}")
+            result = None
+        except (OSError, json.JSONDecodeError, DataValidationError) as e:
+            logging.error(f"Unusable data file {self._data_dir / filename}: {e}")
+            result = None
+            try:
+                self._mtimes[filename] = (self._data_dir / filename).stat().st_mtime_ns
+            except OSError:
+                pass
+        else:
+            self._mtimes[filename] = mtime
+        if result is None:
+            result = MODEL_PARSERS[filename]({}) if has_models else {}
+        if has_models:
+            self._models[filename] = result
+        else:
+            self._cache[filename] = result
+        return result
         
     def load_json(self, filename: str) -> Dict[str, Any]:
-        """Loads a JSON file from the data directory."""
+        """Parsed JSON of a data file without a model view (cached)."""
         if filename in self._cache:
             return self._cache[filename]
-            
-        path = DATA_DIR / filename
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self._cache[filename] = data
-                return data
-        except FileNotFoundError:
-            logging.error(f"File not found: {path}")
-            return {}
-        except json.JSONDecodeError as e:
-            logging.error(f"JSON Decode Error in {path}: {e}")
-            return {}
+        return self._load(filename)
+
+    def _get_models(self, filename: str):
+        models = self._models.get(filename)
+        if models is not None:
+            return models
+        if filename in self._cache:
+            # From the bundle: only the typed view is kept
+            data = self._cache.pop(filename)
+            try:
+                models = self._parse_models(filename, data)
+            except DataValidationError as e:
+                logging.error(f"Unusable data file {filename}: {e}")
+                models = MODEL_PARSERS[filename]({})
+            self._models[filename] = models
+            return models
+        return self._load(filename)
+
+    def preload(self, filenames: Optional[Iterable[str]] = None) -> "DataLoader":
+        """
+        Reads the static data files up front (default: APP_DATA_FILES, the
+        ones the app reads). Afterwards the loader only serves from its cache,
+        so it can back several sessions without further IO.
+        """
+        if filenames is None:
+            filenames = APP_DATA_FILES
+        for filename in filenames:
+            if filename in MODEL_PARSERS:
+                self._get_models(filename)
+            else:
+                self.load_json(filename)
+        return self
 
-    def get_locations(self) -> Dict[str, Any]:
-        return self.load_json("locations.json")
+    def invalidate(self, *filenames: str):
+        """Drops cached files so the next load re-reads them. No args clears everything."""
+        if not filenames:
+            self._cache.clear()
+            self._mtimes.clear()
+            self._models.clear()
+            return
+        for filename in filenames:
+            self._cache.pop(filename, None)
+            self._mtimes.pop(filename, None)
+            self._models.pop(filename, None)
+
+    def reload_changed(self) -> FrozenSet[str]:
+        """
+        Hot reload: re-reads the cached files modified on disk since they were
+        loaded (mtime polling) and returns their names. A file that does not
+        parse (e.g. saved half-way) keeps its previous data and is retried
+        after its next modification. Callers pass the names on to the
+        dependent caches (StateManager.reload_data).
+        """
+        changed = []
+        for filename, mtime in list(self._mtimes.items()):
+            path = self._data_dir / filename
+            try:
+                current = path.stat().st_mtime_ns
+            except OSError:
+                continue # Deleted or being replaced: keep the cached data
+            if current == mtime:
+                continue
+            self._mtimes[filename] = current
+            try:
+                data, _ = self._read(filename)
+                if filename in MODEL_PARSERS:
+                    self._models[filename] = self._parse_models(filename, data)
+                    self._cache.pop(filename, None)
+                else:
+                    self._cache[filename] = data
+            except (OSError, json.JSONDecodeError, DataValidationError) as e:
+                logging.error(f"Hot reload: keeping previous {filename} ({e})")
+                continue
+            changed.append(filename)
+        if changed:
+            logging.info(f"DataLoader: reloaded {', '.join(changed)}.")
+        return frozenset(changed)
 
     def get_locations_logic(self) -> Dict[str, Any]:
         return self.load_json("locations_logic.json")
 
-    def get_cities(self) -> Dict[str, Any]:
-        return self.load_json("cities.json")
-
-    def get_items_spells(self) -> Dict[str, Any]:
-        return self.load_json("items_spells.json")
-        
     def get_tool_items(self) -> Dict[str, Any]:
         return self.load_json("tool_items.json")
 
+    def get_location_name_mapping(self) -> Dict[str, str]:
+        """{internal_name: spoiler_log_name}"""
+        return self.load_json("location_name_mapping.json")
+
+    # --- Typed views (core.models), shared and read-only ---
+
+    def get_location_models(self) -> Dict[str, Location]:
+        return self._get_models("locations.json")
+
+    def get_city_models(self) -> Dict[str, City]:
+        return self._get_models("cities.json")
+
+    def get_character_models(self, black_and_white: bool = False) -> Dict[str, Character]:
+        return self._get_models("characters_bw.json" if black_and_white else "characters.json")
+
+    def get_item_models(self) -> Dict[str, Tuple[Item, ...]]:
+        """{category: items in file order}"""
+        return self._get_models("items_spells.json")
+
+    def get_shop_entries(self) -> Dict[str, Tuple[ShopEntry, ...]]:
+        """{shop location: entries in file order}"""
+        return self._get_models("shop_data.json")
+
     def resolve_image_path(self, relative_path: str) -> str:
         """Resolves a relative image path to an absolute system path."""
         full_path = IMAGES_DIR / relative_path
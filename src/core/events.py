@@ -0,0 +1,58 @@
+"""
+Minimal observer layer for the core (no Qt required).
+
+Declared like pyqtSignal and used the same way:
+
+    class StateManager:
+        location_changed = Signal(str, str)
+
+    state_manager.location_changed.connect(callback)
+    state_manager.location_changed.emit("Tanbel", "cleared")
+
+Callbacks run synchronously, in connection order, on the emitting thread.
+The GUI wraps these in Qt signals (gui/qt_state.py).
+"""
+from typing import Callable, List
+
+
+class BoundSignal:
+    __slots__ = ("name", "_callbacks")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._callbacks: List[Callable] = []
+
+    def connect(self, callback: Callable):
+        self._callbacks.append(callback)
+
+    def disconnect(self, callback: Callable = None):
+        """Removes one callback, or all of them when called without one."""
+        if callback is None:
+            self._callbacks.clear()
+        else:
+            self._callbacks.remove(callback)
+
+    def emit(self, *args):
+        for callback in tuple(self._callbacks): # Callbacks may disconnect while running
+            callback(*args)
+
+    def __len__(self):
+        return len(self._callbacks)
+
+
+class Signal:
+    """Class-level declaration; each instance gets its own BoundSignal on first access."""
+
+    def __init__(self, *types):
+        self.types = types # Documentation only (mirrors the pyqtSignal signature)
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        bound = BoundSignal(self.name)
+        instance.__dict__[self.name] = bound # Later lookups skip the descriptor
+        return bound
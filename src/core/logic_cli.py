@@ -0,0 +1,93 @@
+"""
+Headless logic runner (no PyQt6 import).
+
+Usage (from the src directory):
+    python -m core.logic_cli [--deltas] [--missing] < snapshots.jsonl
+
+Every stdin line is one JSON object:
+    {"inventory": {"Bomb": true, ...}}   full inventory snapshot
+    {"item": "Hook", "obtained": true}   single item toggle ("obtained" defaults to true)
+    {"Bomb": true, ...}                  bare dict = inventory snapshot
+
+Every result is written as one JSON line on stdout:
+    {"seq": 1, "accessibility": {...}}   full map (default)
+    {"seq": 1, "changed": {...}}         only flipped locations (--deltas)
+    {"seq": 1, "error": "..."}           invalid input line (e.g. a non-boolean "obtained")
+With --deltas a baseline line (seq 0, empty inventory) is written first.
+"""
+import argparse
+import json
+import sys
+
+from core.data_loader import DataLoader
+from core.logic_engine import LogicEngine
+
+
+def _handle_line(engine: LogicEngine, message, deltas: bool) -> dict:
+    if not isinstance(message, dict):
+        raise ValueError("Expected a JSON object")
+
+    if "item" in message:
+        item = message["item"]
+        obtained = message.get("obtained", True)
+        if not isinstance(item, str):
+            raise ValueError("'item' must be a string")
+        if not isinstance(obtained, bool):
+            raise ValueError(f"'obtained' must be true or false, got {obtained!r}")
+        changed = engine.apply_delta(item, obtained)
+    else:
+        inventory = message.get("inventory", message)
+        if not isinstance(inventory, dict):
+            raise ValueError("'inventory' must be a JSON object")
+        invalid = [name for name, obtained in inventory.items() if not isinstance(obtained, bool)]
+        if invalid:
+            raise ValueError(f"Inventory values must be true or false: {', '.join(sorted(invalid))}")
+        changed = engine.apply_inventory(inventory)
+
+    if deltas:
+        return {"changed": changed}
+    return {"accessibility": dict(engine.tracked_accessibility)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream Lufia 2 location accessibility as JSON lines.")
+    parser.add_argument("--deltas", action="store_true",
+                        help="Only write locations whose accessibility flipped.")
+    parser.add_argument("--missing", action="store_true",
+                        help="Add missing requirements for inaccessible locations.")
+    args = parser.parse_args(argv)
+
+    engine = LogicEngine(DataLoader())
+    baseline = engine.track_inventory({})
+    out = sys.stdout
+
+    def write(payload):
+        out.write(json.dumps(payload, sort_keys=True) + "\n")
+        out.flush()
+
+    if args.deltas:
+        write({"seq": 0, "accessibility": baseline})
+
+    for seq, line in enumerate(sys.stdin, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            result = _handle_line(engine, json.loads(line), args.deltas)
+        except (ValueError, TypeError) as e:
+            write({"seq": seq, "error": str(e)})
+            continue
+
+        if args.missing:
+            inventory = engine.tracked_inventory()
+            result["missing"] = {
+                location: engine.get_missing_requirements(location, inventory)
+                for location, accessible in engine.tracked_accessibility.items()
+                if not accessible
+            }
+        result["seq"] = seq
+        write(result)
+
+
+if __name__ == "__main__":
+    main()
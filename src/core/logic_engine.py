@@ -1,7 +1,22 @@
+import copy
 import logging
-from typing import Dict, Set, Any
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Set, Any, Tuple, Mapping, List, NamedTuple, Optional, Callable
 from core.data_loader import DataLoader
-from utils.constants import ALWAYS_ACCESSIBLE_LOCATIONS
+from core.rule_parser import (
+    RuleSyntaxError, parse_rule, rule_items, to_masks, compile_rule, evaluate_columns
+)
+from utils.constants import ALWAYS_ACCESSIBLE_LOCATIONS, GOAL_LOCATION
+
+
+class SeedSolution(NamedTuple):
+    """Result of LogicEngine.solve_seed."""
+    spheres: List[List[str]]          # locations opened at each step
+    sphere_items: List[List[str]]     # logic items collected from each sphere
+    required_items: List[str]         # items without which the goal is unreachable
+    goal_reachable: bool
+
 
 class LogicEngine:
     """
@@ -9,99 +24,526 @@ class LogicEngine:
     Decoupled from UI and State. 
     Accepts inventory/state snapshots and returns accessibility maps.
     """
+
+    # Max number of inventory fingerprints kept in the accessibility memo
+    CACHE_SIZE = 128
+    # Max number of (location, fingerprint) entries kept for missing requirements
+    MISSING_CACHE_SIZE = 2048
+    
+    # Data files the compiled rules are built from
+    LOGIC_FILES = frozenset({"locations_logic.json", "cities.json"})
     
     def __init__(self, data_loader: DataLoader):
-        self._locations_logic = data_loader.get_locations_logic()
-        self._cities = data_loader.get_cities()
-        
-    def calculate_accessibility(self, inventory: Dict[str, bool]) -> Dict[str, bool]:
+        self._data_loader = data_loader
+        self._origin: Optional["LogicEngine"] = None # Engine a session() was created from
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._load_logic()
+
+    def _load_logic(self):
+        self._locations_logic = self._data_loader.get_locations_logic()
+        self._cities = self._data_loader.get_city_models()
+        # New memo objects (not cleared in place): sessions still on the
+        # previous rules keep memos that match their tables
+        self._accessibility_cache: "OrderedDict[int, Dict[str, bool]]" = OrderedDict()
+        self._missing_cache: "OrderedDict[Tuple[str, int], Tuple[str, ...]]" = OrderedDict()
+        self._compile_rules()
+
+    @property
+    def data_loader(self) -> DataLoader:
+        """The DataLoader the logic was read from (shared with other core components)."""
+        return self._data_loader
+
+    def reload(self, inventory: Optional[Dict[str, bool]] = None, reread: bool = True) -> Set[str]:
         """
-        Calculates accessibility for ALL locations based on current inventory.
-        Input: inventory dict {item_name: bool}
-        Output: accessibility dict {location_name: bool}
+        Recompiles the logic data and re-tracks the inventory (hot reload).
+        Pass the full inventory: items the previous rules never mentioned are
+        not part of the tracked mask. reread=False uses the data the loader
+        already refreshed (DataLoader.reload_changed). A session adopts the
+        tables of the engine it was created from, which compiles only once.
+        Returns the locations whose accessibility or rules changed.
+        """
+        if inventory is None:
+            inventory = self.tracked_inventory()
+        previous_logic, previous_cities = self._locations_logic, self._cities
+        previous_accessibility = self._tracked_accessibility
+
+        origin = self._origin
+        if origin is None:
+            if reread:
+                self._data_loader.invalidate(*self.LOGIC_FILES)
+            self._load_logic()
+        else:
+            if origin._compiled_rules is self._compiled_rules:
+                origin.reload(reread=reread)
+            shared = {
+                name: value for name, value in vars(origin).items()
+                if name not in ("_origin", "_tracked_mask", "_tracked_accessibility")
+            }
+            self.__dict__.update(shared)
+
+        accessibility = self.track_inventory(inventory)
+        changed = {
+            location for location in previous_accessibility.keys() | accessibility.keys()
+            if previous_accessibility.get(location) != accessibility.get(location)
+        }
+        changed.update(
+            location for location in previous_logic.keys() | self._locations_logic.keys()
+            if previous_logic.get(location) != self._locations_logic.get(location)
+        )
+        changed.update(previous_cities.keys() ^ self._cities.keys())
+        logging.info(f"LogicEngine: logic data reloaded ({len(changed)} locations changed).")
+        return changed
+
+    def session(self) -> "LogicEngine":
+        """
+        Lightweight engine for one more tracker state over the same data.
+        Shares the compiled rule tables and the accessibility/missing memos
+        (both keyed by inventory mask only) and gets its own tracked
+        inventory, so apply_delta on one session never affects another.
+        reload() on a session recompiles this engine once and shares the result.
+        """
+        session = copy.copy(self)
+        session._origin = self
+        session._tracked_mask = 0
+        session._tracked_accessibility = dict(self._evaluate_cached(0))
+        return session
+
+    def clear_cache(self):
+        self._accessibility_cache.clear()
+        self._missing_cache.clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        """Hit/miss counters of the accessibility memo."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._accessibility_cache),
+            "maxsize": self.CACHE_SIZE,
+        }
+
+    def _compile_rules(self):
         """
-        # Convert inventory dict to a set of obtained items for faster lookup
-        obtained_items_set = {item for item, obtained in inventory.items() if obtained}
-        
-        accessibility_map = {}
+        Compiles access_rules into integer bitmask tables (done once).
+        Every item name gets a bit index; each location stores its
+        OR-of-ANDs as a tuple of masks. A rule is satisfied when
+        (inventory_mask & rule) == rule, so a 0 mask is always satisfied.
+        Rules that cannot be expanded into masks (negation, huge counts)
+        are compiled into evaluator closures instead (see core.rule_parser).
+        """
+        self._item_bits: Dict[str, int] = {}
+        self._bit_names: Dict[int, str] = {}
+        self._compiled_rules: Dict[str, Tuple[int, ...]] = {}
+        self._programs: Dict[str, Callable[[int], bool]] = {} # location -> closure
+        self._program_rules: Dict[str, tuple] = {}            # location -> parsed rules (batch path)
+        self._location_items: Dict[str, Tuple[int, ...]] = {} # location -> item bits, display order
+
         # Iterate over both Logic locations AND Cities (which might be missing from logic)
         all_relevant_locations = set(self._locations_logic.keys()) | set(self._cities.keys())
-        
+
         for location in all_relevant_locations:
-            is_accessible = self._check_location(location, obtained_items_set)
-            accessibility_map[location] = is_accessible
-            
-        return accessibility_map
+            self._compiled_rules[location] = self._compile_location(location)
 
-    def get_missing_requirements(self, location, inventory):
-        """
-        Returns a list of missing items/conditions for a specific location.
-        """
-        logic = self._locations_logic.get(location)
-        if not logic:
-            return []
-            
-        access_rules = logic.get("access_rules", [])
-        if not access_rules:
-            return []
-            
-        # Helper to format a single rule
-        formatted_rules = []
-        for rule in access_rules:
-            # Rule is typically a list of requirements (AND) or a single string
-            if isinstance(rule, list):
-                 # e.g. ["Bomb", "Hook"] -> "Bomb & Hook"
-                 # Filter out empty strings or None
-                 reqs = [str(r) for r in rule if r]
-                 formatted_rules.append(" & ".join(reqs))
-            elif isinstance(rule, str):
-                 formatted_rules.append(rule)
-            else:
-                 formatted_rules.append(str(rule))
-                 
-        # Deduplicate
-        formatted_rules = sorted(list(set(formatted_rules)))
-        
-        # If no rules, return empty
-        if not formatted_rules:
-            return []
-            
-        return formatted_rules
+        # Reverse dependency index: item bit -> locations whose rules mention it
+        dependents: Dict[int, list] = {}
+        for location, bits in self._location_items.items():
+            for bit in bits:
+                dependents.setdefault(bit, []).append(location)
+        self._dependents: Dict[int, Tuple[str, ...]] = {
+            bit: tuple(sorted(locations)) for bit, locations in dependents.items()
+        }
+
+        # Dense rule matrices for batch evaluation, built on first use
+        self._batch_tables = None
 
-    def _check_location(self, location: str, obtained_items: Set[str]) -> bool:
+        # Tracked inventory for incremental updates (see apply_delta)
+        self._tracked_mask = 0
+        self._tracked_accessibility = self._evaluate_all(0)
+
+    def _compile_location(self, location: str) -> Tuple[int, ...]:
         """
-        Determines if a single location is accessible.
+        Compiles the rules of a single location into masks.
         Logic ported directly from v1.3 LocationLogic.is_location_accessible
         """
         # 1. Always Accessible Check
         if location in ALWAYS_ACCESSIBLE_LOCATIONS:
-            return True
-            
+            return (0,)
+
         logic = self._locations_logic.get(location)
         if logic is None:
             # If it's a City with no logic defined, it's considered accessible (Yellow) by default in v1.3
             if location in self._cities:
-                return True
-            return False # Not in logic file and not a city? Default to inaccessible.
+                return (0,)
+            return () # Not in logic file and not a city? Default to inaccessible.
 
         access_rules = logic.get("access_rules", [])
-        
+
         # 2. Empty rules = Accessible
         if not access_rules:
-            return True 
-            
-        # 3. Rule Evaluation (OR Logic between list items)
+            return (0,)
+
+        # 3. Rule Compilation (OR Logic between list items)
+        nodes = []
         for rule in access_rules:
-            # Rule is a string like "Bomb,Hook" (AND Logic)
-            required_items = [item.strip() for item in rule.split(',')]
-            
-            # Check if ALL required items for this rule are present
-            if all(req in obtained_items for req in required_items):
+            try:
+                nodes.append(parse_rule(rule))
+            except RuleSyntaxError as e:
+                logging.error(f"Ignoring invalid access rule for {location}: {e}")
+
+        items = {}
+        for node in nodes:
+            for item in rule_items(node):
+                items.setdefault(self._item_bit(item))
+        self._location_items[location] = tuple(items)
+
+        masks = []
+        for node in nodes:
+            node_masks = to_masks(node, self._item_bit)
+            if node_masks is None:
+                break
+            masks.extend(node_masks)
+        else:
+            return tuple(dict.fromkeys(masks))
+
+        # Not expressible as masks: evaluate the whole location with closures
+        programs = tuple(compile_rule(node, self._item_bit) for node in nodes)
+        self._programs[location] = lambda mask: any(program(mask) for program in programs)
+        self._program_rules[location] = tuple(nodes)
+        return ()
+
+    def _item_bit(self, item: str) -> int:
+        """Returns the mask bit for an item, interning it on first sight."""
+        bit = self._item_bits.get(item)
+        if bit is None:
+            bit = 1 << len(self._item_bits)
+            self._item_bits[item] = bit
+            self._bit_names[bit] = item
+        return bit
+
+    def inventory_mask(self, inventory: Dict[str, bool]) -> int:
+        """
+        Folds an inventory dict {item_name: bool} into a bitmask.
+        Items that no rule mentions are ignored.
+        """
+        item_bits = self._item_bits
+        mask = 0
+        for item, obtained in inventory.items():
+            if obtained:
+                mask |= item_bits.get(item, 0)
+        return mask
+
+    @staticmethod
+    def _iter_bits(mask: int):
+        """Yields every set bit of a mask as its own power-of-two mask."""
+        while mask:
+            bit = mask & -mask
+            yield bit
+            mask ^= bit
+
+    def _location_items_mask(self, location: str) -> int:
+        """Union of all items mentioned by a location's rules."""
+        items_mask = 0
+        for bit in self._location_items.get(location, ()):
+            items_mask |= bit
+        return items_mask
+
+    @property
+    def item_names(self) -> Tuple[str, ...]:
+        """Items in bit order (column order of the batch inventory matrix)."""
+        return tuple(self._item_bits)
+
+    @property
+    def location_names(self) -> Tuple[str, ...]:
+        """Locations in column order of the batch accessibility matrix."""
+        return tuple(self._compiled_rules)
+
+    def dependent_locations(self, item: str) -> Tuple[str, ...]:
+        """Returns the locations whose access rules mention the given item."""
+        bit = self._item_bits.get(item)
+        if bit is None:
+            return ()
+        return self._dependents.get(bit, ())
+
+    @staticmethod
+    def _rules_satisfied(rules: Tuple[int, ...], mask: int) -> bool:
+        for rule in rules:
+            if mask & rule == rule:
                 return True
-                
-        # If no rule is satisfied
         return False
 
+    def _is_satisfied(self, location: str, mask: int) -> bool:
+        program = self._programs.get(location)
+        if program is not None:
+            return program(mask)
+        return self._rules_satisfied(self._compiled_rules[location], mask)
+
+    def calculate_accessibility(self, inventory: Dict[str, bool]) -> Dict[str, bool]:
+        """
+        Calculates accessibility for ALL locations based on current inventory.
+        Input: inventory dict {item_name: bool}
+        Output: accessibility dict {location_name: bool}
+        """
+        return dict(self._evaluate_cached(self.inventory_mask(inventory)))
+
+    def _evaluate_cached(self, mask: int) -> Dict[str, bool]:
+        """
+        LRU memo keyed by the inventory fingerprint (the obtained-items mask).
+        The returned dict is shared with the cache, callers must copy it.
+        """
+        cache = self._accessibility_cache
+        result = cache.get(mask)
+        if result is not None:
+            cache.move_to_end(mask)
+            self._cache_hits += 1
+            return result
+
+        self._cache_misses += 1
+        result = self._evaluate_all(mask)
+        cache[mask] = result
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def _evaluate_all(self, mask: int) -> Dict[str, bool]:
+        satisfied = self._rules_satisfied
+        result = {
+            location: satisfied(rules, mask)
+            for location, rules in self._compiled_rules.items()
+        }
+        for location, program in self._programs.items():
+            result[location] = program(mask)
+        return result
+
+    # --- Batch Evaluation ---
+
+    # Elements per temporary matrix (rows x widest of items/rules/locations):
+    # bounds peak memory (about 16 MB per float32 temporary) whatever the logic size
+    BATCH_CHUNK_ELEMENTS = 1 << 22
+
+    def inventory_matrix(self, inventories):
+        """
+        Stacks inventory dicts into an N x len(item_names) boolean matrix
+        suitable for calculate_accessibility_batch.
+        """
+        import numpy as np
+
+        matrix = np.zeros((len(inventories), len(self._item_bits)), dtype=bool)
+        columns = {item: index for index, item in enumerate(self._item_bits)}
+        for row, inventory in enumerate(inventories):
+            for item, obtained in inventory.items():
+                column = columns.get(item)
+                if obtained and column is not None:
+                    matrix[row, column] = True
+        return matrix
+
+    def calculate_accessibility_batch(self, inventories):
+        """
+        Evaluates many inventories at once.
+        Input: N x len(item_names) boolean matrix (columns in item_names order)
+        Output: N x len(location_names) boolean matrix
+
+        A rule is satisfied when none of its required items are missing,
+        i.e. (~inventory) @ requirements == 0. A location is accessible when
+        any of its rules is satisfied.
+        """
+        import numpy as np
+
+        inventories = np.asarray(inventories, dtype=bool)
+        if inventories.ndim != 2 or inventories.shape[1] != len(self._item_bits):
+            raise ValueError(
+                f"Expected an N x {len(self._item_bits)} inventory matrix, got shape {inventories.shape}"
+            )
+
+        requirements, rule_owner = self._get_batch_tables()
+
+        result = np.empty((inventories.shape[0], len(self._compiled_rules)), dtype=bool)
+        width = max(requirements.shape[0], requirements.shape[1], rule_owner.shape[1], 1)
+        chunk_rows = max(1, self.BATCH_CHUNK_ELEMENTS // width)
+        for start in range(0, inventories.shape[0], chunk_rows):
+            chunk = inventories[start:start + chunk_rows]
+            missing = (~chunk).astype(np.float32) @ requirements
+            satisfied = (missing == 0).astype(np.float32)
+            result[start:start + len(chunk)] = (satisfied @ rule_owner) > 0
+
+        # Closure-compiled locations are evaluated column-wise from their parsed rules
+        if self._program_rules:
+            columns = {item: inventories[:, index] for index, item in enumerate(self._item_bits)}
+            location_index = {location: index for index, location in enumerate(self._compiled_rules)}
+            for location, nodes in self._program_rules.items():
+                accessible = np.zeros(inventories.shape[0], dtype=bool)
+                for node in nodes:
+                    accessible |= evaluate_columns(node, columns.__getitem__)
+                result[:, location_index[location]] = accessible
+        return result
+
+    def _get_batch_tables(self):
+        """
+        requirements: items x rules (1.0 where the rule needs the item)
+        rule_owner:   rules x locations (1.0 where the rule belongs to the location)
+        """
+        if self._batch_tables is None:
+            import numpy as np
+
+            rules = [
+                (location_index, rule)
+                for location_index, location_rules in enumerate(self._compiled_rules.values())
+                for rule in location_rules
+            ]
+            item_count = len(self._item_bits)
+            requirements = np.zeros((item_count, len(rules)), dtype=np.float32)
+            rule_owner = np.zeros((len(rules), len(self._compiled_rules)), dtype=np.float32)
+            for rule_index, (location_index, rule) in enumerate(rules):
+                for item_index in range(item_count):
+                    if rule >> item_index & 1:
+                        requirements[item_index, rule_index] = 1.0
+                rule_owner[rule_index, location_index] = 1.0
+            self._batch_tables = (requirements, rule_owner)
+        return self._batch_tables
+
+    # --- Incremental Tracking ---
+
+    def track_inventory(self, inventory: Dict[str, bool]) -> Dict[str, bool]:
+        """
+        Full recomputation that also becomes the baseline for apply_delta /
+        apply_inventory. Returns the complete accessibility map.
+        """
+        self._tracked_mask = self.inventory_mask(inventory)
+        self._tracked_accessibility = dict(self._evaluate_cached(self._tracked_mask))
+        return dict(self._tracked_accessibility)
+
+    def apply_delta(self, item: str, obtained: bool) -> Dict[str, bool]:
+        """
+        Applies a single item toggle to the tracked inventory.
+        Only re-evaluates the locations whose rules mention the item.
+        Returns {location_name: new_accessibility} for locations that flipped.
+        """
+        bit = self._item_bits.get(item)
+        if bit is None:
+            return {}
+
+        new_mask = (self._tracked_mask | bit) if obtained else (self._tracked_mask & ~bit)
+        return self._apply_mask(new_mask)
+
+    def apply_inventory(self, inventory: Dict[str, bool]) -> Dict[str, bool]:
+        """
+        Diffs a full inventory snapshot against the tracked one and applies
+        the changed items as deltas. Returns only the locations that flipped.
+        """
+        return self._apply_mask(self.inventory_mask(inventory))
+
+    def tracked_inventory(self) -> Dict[str, bool]:
+        """The tracked inventory as {item_name: True} (logic-relevant items only)."""
+        return {self._bit_names[bit]: True for bit in self._iter_bits(self._tracked_mask)}
+
+    @property
+    def tracked_accessibility(self) -> Mapping[str, bool]:
+        """Read-only view of the accessibility map of the tracked inventory."""
+        return MappingProxyType(self._tracked_accessibility)
+
+    def _dependents_of(self, changed_bits: int) -> Set[str]:
+        candidates = set()
+        for bit in self._iter_bits(changed_bits):
+            candidates.update(self._dependents.get(bit, ()))
+        return candidates
+
+    def _apply_mask(self, new_mask: int) -> Dict[str, bool]:
+        changed_bits = new_mask ^ self._tracked_mask
+        self._tracked_mask = new_mask
+        if not changed_bits:
+            return {}
+
+        candidates = self._dependents_of(changed_bits)
+
+        flipped = {}
+        tracked = self._tracked_accessibility
+        for location in candidates:
+            is_accessible = self._is_satisfied(location, new_mask)
+            if tracked[location] != is_accessible:
+                tracked[location] = is_accessible
+                flipped[location] = is_accessible
+        return flipped
+
+    def unlocks_for(self, item: str) -> List[str]:
+        """
+        Locations that are inaccessible for the tracked inventory but would
+        open if the item were obtained. Only the item's dependents are checked.
+        """
+        bit = self._item_bits.get(item)
+        if bit is None or self._tracked_mask & bit:
+            return []
+
+        mask = self._tracked_mask | bit
+        tracked = self._tracked_accessibility
+        return [
+            location for location in self._dependents.get(bit, ())
+            if not tracked[location] and self._is_satisfied(location, mask)
+        ]
+
+    def rank_next_items(self, candidates) -> List[Tuple[str, List[str]]]:
+        """
+        Ranks candidate items by how many locations each would open right now
+        (relative to the tracked inventory), most impactful first.
+        Returns [(item, unlocked_locations)]; items already obtained are skipped.
+        Costs one pass over the dependents of every candidate, i.e. about one
+        refresh for all of them together.
+        """
+        ranking = []
+        for item in candidates:
+            bit = self._item_bits.get(item, 0)
+            if bit and self._tracked_mask & bit:
+                continue
+            ranking.append((item, self.unlocks_for(item)))
+
+        ranking.sort(key=lambda entry: -len(entry[1]))
+        return ranking
+
+    def get_missing_requirements(self, location, inventory):
+        """
+        Returns the items still missing for a specific location, one entry per
+        alternative rule (e.g. ["Hook", "Bomb & Cloud"]), fewest missing first.
+        Accessible locations and locations without logic return [].
+        """
+        if location not in self._compiled_rules:
+            return []
+
+        # Only the items this location cares about matter for the fingerprint
+        mask = self.inventory_mask(inventory) & self._location_items_mask(location)
+        key = (location, mask)
+
+        cache = self._missing_cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return list(result)
+
+        if self._is_satisfied(location, mask):
+            result = ()
+        elif location in self._programs:
+            # Closure-compiled rules have no item lists, show the rules themselves
+            access_rules = self._locations_logic[location].get("access_rules", [])
+            result = tuple(sorted({str(rule) for rule in access_rules}))
+        else:
+            alternatives = {rule & ~mask for rule in self._compiled_rules[location]}
+
+            # Drop alternatives that need a superset of another alternative's items
+            minimal = [
+                missing for missing in alternatives
+                if not any(other != missing and other & missing == other for other in alternatives)
+            ]
+            minimal.sort(key=lambda m: (bin(m).count("1"), m))
+
+            # Items are listed in the order they appear in the location's rules
+            order = self._location_items[location]
+            result = tuple(
+                " & ".join(self._bit_names[bit] for bit in order if bit & missing)
+                for missing in minimal
+            )
+
+        cache[key] = result
+        if len(cache) > self.MISSING_CACHE_SIZE:
+            cache.popitem(last=False)
+        return list(result)
+
     def determine_color(self, location: str, is_accessible: bool, is_cleared: bool) -> str:
         """
         Determines the semantic color/state for the UI.
@@ -119,3 +561,75 @@ class LogicEngine:
             return "city" if is_accessible else "not_accessible"
             
         return "fully_accessible" if is_accessible else "not_accessible"
+
+    # --- Seed Solver ---
+
+    def solve_seed(self, placements: Dict[str, str], inventory: Optional[Dict[str, bool]] = None,
+                   goal: str = GOAL_LOCATION) -> SeedSolution:
+        """
+        Plays through a placed seed (location -> item, e.g. from the spoiler log).
+        Iterates to a fixpoint: every location opened in a sphere hands out its
+        item, and only the locations depending on the newly gained items are
+        re-checked for the next sphere.
+        Placements of items no rule mentions (characters etc.) are ignored.
+        """
+        placed_bits = self._placement_bits(placements)
+        start_mask = self.inventory_mask(inventory or {})
+
+        spheres, sphere_items, _ = self._run_spheres(placed_bits, start_mask)
+        goal_sphere = next((index for index, sphere in enumerate(spheres) if goal in sphere), None)
+        goal_reachable = goal_sphere is not None
+
+        # An item can only be required if it was collected before the goal opened.
+        # Check each of those by solving again with all of its placements removed.
+        required_items = []
+        if goal_reachable:
+            for items in sphere_items[:goal_sphere]:
+                for item in items:
+                    bit = self._item_bits[item]
+                    without = {location: b for location, b in placed_bits.items() if b != bit}
+                    _, _, opened = self._run_spheres(without, start_mask, goal)
+                    if goal not in opened:
+                        required_items.append(item)
+
+        return SeedSolution(spheres, sphere_items, required_items, goal_reachable)
+
+    def _placement_bits(self, placements: Dict[str, str]) -> Dict[str, int]:
+        """location -> item bit, for placed items that some rule mentions."""
+        placed_bits = {}
+        for location, item in placements.items():
+            bit = self._item_bits.get(item)
+            if bit:
+                placed_bits[location] = bit
+        return placed_bits
+
+    def _run_spheres(self, placed_bits: Dict[str, int], mask: int, stop_at: Optional[str] = None):
+        """
+        Worklist fixpoint. Returns (spheres, sphere_items, opened_locations).
+        Stops early once stop_at has been opened.
+        """
+        # Sphere 0 needs one full sweep, afterwards only dependents are checked
+        frontier = [location for location, accessible in self._evaluate_all(mask).items() if accessible]
+        opened: Set[str] = set()
+        spheres: List[List[str]] = []
+        sphere_items: List[List[str]] = []
+
+        while frontier:
+            frontier.sort()
+            opened.update(frontier)
+            spheres.append(frontier)
+            if stop_at in opened:
+                break
+
+            new_bits = 0
+            for location in frontier:
+                bit = placed_bits.get(location, 0)
+                if bit and not mask & bit:
+                    new_bits |= bit
+            sphere_items.append([self._bit_names[bit] for bit in self._iter_bits(new_bits)])
+            mask |= new_bits
+
+            candidates = self._dependents_of(new_bits) - opened
+            frontier = [location for location in candidates if self._is_satisfied(location, mask)]
+
+        return spheres, sphere_items, opened
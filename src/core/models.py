@@ -0,0 +1,224 @@
+"""
+Typed, read-only views of the static data files.
+
+Each supported file is validated once when it is read (DataLoader) or
+bundled (core.data_bundle) and turned into frozen, slotted dataclasses.
+Bad entries fail right there with a DataValidationError naming the file
+and the entry, instead of a KeyError the first time a widget touches them.
+Parsers given an `errors` list skip bad entries and collect their errors
+there (the rest of the file stays usable); without one they raise.
+
+Every model gets an integer `id`: its position in the file, stable for a
+given data version. Hex strings of the ROM data (item codes, addresses)
+are stored as ints.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class DataValidationError(ValueError):
+    """A static data file does not match the expected structure."""
+
+    def __init__(self, filename: str, key, message: str):
+        super().__init__(f"{filename}: {key!r}: {message}")
+        self.filename = filename
+        self.key = key
+
+
+@dataclass(frozen=True, slots=True)
+class Location:
+    id: int
+    name: str
+    x: float  # Game world coordinates (GAME_WORLD_SIZE)
+    y: float
+
+
+@dataclass(frozen=True, slots=True)
+class City:
+    id: int
+    name: str
+    x: float
+    y: float
+
+
+@dataclass(frozen=True, slots=True)
+class Character:
+    id: int
+    name: str
+    image_path: str                         # Relative to IMAGES_DIR
+    down_image_path: Optional[str] = None
+    hp_address: Tuple[int, ...] = ()        # Party members only
+    identifier: Optional[str] = None        # Capsule monsters only
+
+
+@dataclass(frozen=True, slots=True)
+class Item:
+    id: int
+    name: str
+    category: str  # "Weapon", "Armor", "Spell", ...
+    code: int      # Item/spell code from items_spells.json
+
+
+@dataclass(frozen=True, slots=True)
+class ShopEntry:
+    id: int
+    location: str
+    category: str  # "weapon", "armor", "spell"
+    name: str
+    code: int
+
+
+# --- Field checks ---
+
+def _mapping(filename: str, key, value) -> Dict[str, Any]:
+    if not isinstance(value, dict):
+        raise DataValidationError(filename, key, f"expected an object, got {type(value).__name__}")
+    return value
+
+
+def _coords(filename: str, key, value) -> Tuple[float, float]:
+    if (not isinstance(value, (list, tuple)) or len(value) != 2
+            or not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value)):
+        raise DataValidationError(filename, key, f"expected [x, y], got {value!r}")
+    return float(value[0]), float(value[1])
+
+
+def _text(filename: str, key, value, optional: bool = False) -> Optional[str]:
+    if value is None and optional:
+        return None
+    if not isinstance(value, str) or not value:
+        raise DataValidationError(filename, key, f"expected a non-empty string, got {value!r}")
+    return value
+
+
+def _hex(filename: str, key, value) -> int:
+    try:
+        return int(value, 16)
+    except (TypeError, ValueError):
+        raise DataValidationError(filename, key, f"expected a hex string, got {value!r}") from None
+
+
+def _skip(errors: Optional[List[DataValidationError]], error: DataValidationError):
+    """Collects a bad entry's error (lenient parse) or raises it (strict parse)."""
+    if errors is None:
+        raise error
+    errors.append(error)
+
+
+# --- Parsers (raw JSON -> models) ---
+
+def parse_locations(data, filename: str = "locations.json", errors=None) -> Dict[str, Location]:
+    """{name: [x, y]} -> {name: Location}"""
+    data = _mapping(filename, "<root>", data)
+    locations = {}
+    for index, (name, coords) in enumerate(data.items()):
+        try:
+            locations[name] = Location(index, name, *_coords(filename, name, coords))
+        except DataValidationError as e:
+            _skip(errors, e)
+    return locations
+
+
+def parse_cities(data, filename: str = "cities.json", errors=None) -> Dict[str, City]:
+    """{name: [x, y]} -> {name: City}"""
+    data = _mapping(filename, "<root>", data)
+    cities = {}
+    for index, (name, coords) in enumerate(data.items()):
+        try:
+            cities[name] = City(index, name, *_coords(filename, name, coords))
+        except DataValidationError as e:
+            _skip(errors, e)
+    return cities
+
+
+def _character(filename: str, index: int, name: str, entry) -> Character:
+    entry = _mapping(filename, name, entry)
+    hp_address = entry.get("hp_address") or ()
+    if not isinstance(hp_address, (list, tuple)):
+        raise DataValidationError(filename, name, f"hp_address must be a list, got {hp_address!r}")
+    return Character(
+        index,
+        name,
+        _text(filename, name, entry.get("image_path")),
+        _text(filename, name, entry.get("down_image_path"), optional=True),
+        tuple(_hex(filename, name, address) for address in hp_address),
+        _text(filename, name, entry.get("identifier"), optional=True),
+    )
+
+
+def parse_characters(data, filename: str = "characters.json", errors=None) -> Dict[str, Character]:
+    """{name: {"image_path", ...}} -> {name: Character}"""
+    data = _mapping(filename, "<root>", data)
+    characters = {}
+    for index, (name, entry) in enumerate(data.items()):
+        try:
+            characters[name] = _character(filename, index, name, entry)
+        except DataValidationError as e:
+            _skip(errors, e)
+    return characters
+
+
+def parse_items(data, filename: str = "items_spells.json", errors=None) -> Dict[str, Tuple[Item, ...]]:
+    """{category: {hex_code: name}} -> {category: (Item, ...)} in file order"""
+    data = _mapping(filename, "<root>", data)
+    items = {}
+    next_id = 0
+    for category, entries in data.items():
+        try:
+            entries = _mapping(filename, category, entries)
+        except DataValidationError as e:
+            _skip(errors, e)
+            continue
+        category_items = []
+        for code, name in entries.items():
+            try:
+                category_items.append(
+                    Item(next_id, _text(filename, code, name), category, _hex(filename, name, code))
+                )
+            except DataValidationError as e:
+                _skip(errors, e)
+            next_id += 1
+        items[category] = tuple(category_items)
+    return items
+
+
+def parse_shops(data, filename: str = "shop_data.json", errors=None) -> Dict[str, Tuple[ShopEntry, ...]]:
+    """{location: {category: [[name, hex_code], ...]}} -> {location: (ShopEntry, ...)}"""
+    data = _mapping(filename, "<root>", data)
+    shops = {}
+    next_id = 0
+    for location, categories in data.items():
+        try:
+            categories = _mapping(filename, location, categories)
+        except DataValidationError as e:
+            _skip(errors, e)
+            continue
+        entries = []
+        for category, stock in categories.items():
+            if not isinstance(stock, list):
+                _skip(errors, DataValidationError(filename, location, f"{category} must be a list, got {stock!r}"))
+                continue
+            for pair in stock:
+                try:
+                    if not isinstance(pair, (list, tuple)) or len(pair) != 2:
+                        raise DataValidationError(filename, location, f"expected [name, hex_code], got {pair!r}")
+                    name, code = pair
+                    entries.append(
+                        ShopEntry(next_id, location, category, _text(filename, location, name), _hex(filename, name, code))
+                    )
+                except DataValidationError as e:
+                    _skip(errors, e)
+                next_id += 1
+        shops[location] = tuple(entries)
+    return shops
+
+
+# filename -> parser(data, errors=None), used by DataLoader and the data bundle
+MODEL_PARSERS: Dict[str, Callable[..., Any]] = {
+    "locations.json": parse_locations,
+    "cities.json": parse_cities,
+    "characters.json": parse_characters,
+    "characters_bw.json": lambda data, errors=None: parse_characters(data, "characters_bw.json", errors),
+    "items_spells.json": parse_items,
+    "shop_data.json": parse_shops,
+}
@@ -0,0 +1,238 @@
+"""
+Crash-safe persistence helpers.
+
+Autosave layout (AUTOSAVE_DIR):
+    snapshot.json     {"journal_seq": N, "state": StateManager.state_snapshot()}, replaced atomically
+    journal.<n>.jsonl rotated journals waiting for their snapshot to be written
+    journal.jsonl     one {"kind", "key", "value"} record per change, appended live
+
+Compaction never blocks the caller on the snapshot write: the live journal
+is renamed to journal.<n>.jsonl (cheap), a new one is opened, and the
+snapshot covering journals up to <n> is written by an executor (a
+background thread in the GUI). Recovery replays the journals the snapshot
+does not cover, oldest first, so a crash at any point loses nothing.
+Records hold absolute values (never toggles), so replaying one twice is
+harmless.
+
+An IO error (read-only or full disk, directory removed) never reaches the
+caller: it is logged once and autosave stays off for the rest of the session.
+"""
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+from utils.constants import AUTOSAVE_COMPACT_EVERY
+
+
+def atomic_write_bytes(path, data: bytes):
+    """Writes to a temp file in the same directory, fsyncs it, then renames over `path`."""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path, data, indent=None):
+    """atomic_write_bytes for a JSON document."""
+    atomic_write_bytes(path, json.dumps(data, indent=indent).encode('utf-8'))
+
+
+def write_state_file(path, snapshot: dict):
+    """Writes a StateManager.state_snapshot() as a save file (atomic, thread-safe)."""
+    atomic_write_json(path, snapshot, indent=4)
+
+
+def read_state_file(path) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class AutosaveJournal:
+    SNAPSHOT = "snapshot.json"
+    JOURNAL = "journal.jsonl"
+
+    def __init__(self, directory, compact_every: int = AUTOSAVE_COMPACT_EVERY, executor=None):
+        """
+        executor(func, *args) runs snapshot writes (e.g. FileWorker.submit).
+        It must run tasks in submission order. None writes inline.
+        """
+        self._dir = Path(directory)
+        self._compact_every = compact_every
+        self._executor = executor
+        self._file = None
+        self._records = 0
+        self._unsynced = False
+        self._seq = 0 # Number the live journal gets when it is rotated
+        self._snapshot_failed = False # Snapshot write error already logged
+
+    @property
+    def enabled(self) -> bool:
+        """False until open() succeeded, and after an IO error."""
+        return self._file is not None
+
+    def _disable(self, action: str, error: OSError):
+        """Turns autosave off after an IO error instead of failing the user action."""
+        logging.error(f"Autosave: {action} failed ({error}), autosave is off for this session.")
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self._dir / self.SNAPSHOT
+
+    @property
+    def journal_path(self) -> Path:
+        return self._dir / self.JOURNAL
+
+    def _rotated_journals(self) -> List[Tuple[int, Path]]:
+        """[(n, path)] of journal.<n>.jsonl, oldest first."""
+        journals = []
+        for path in self._dir.glob("journal.*.jsonl"):
+            try:
+                journals.append((int(path.name.split(".")[1]), path))
+            except ValueError:
+                continue
+        return sorted(journals)
+
+    def _read_snapshot(self) -> Tuple[Optional[dict], int]:
+        """(state or None, last journal number it covers)."""
+        if not self.snapshot_path.exists():
+            return None, -1
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logging.error(f"Autosave: unreadable snapshot ({e}), replaying journal only.")
+            return None, -1
+        if "state" not in data:
+            return data, -1 # Written before journal rotation existed
+        return data["state"], data.get("journal_seq", -1)
+
+    def recover(self) -> Tuple[Optional[dict], List[dict]]:
+        """Returns (latest snapshot or None, journal records written after it)."""
+        snapshot, covered = self._read_snapshot()
+        journals = [path for seq, path in self._rotated_journals() if seq > covered]
+        if self.journal_path.exists():
+            journals.append(self.journal_path)
+
+        records = []
+        for path in journals:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            records.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            # Torn write from a crash: the rest of this file is unreliable
+                            logging.warning(f"Autosave: truncated record in {path.name}, skipping its tail.")
+                            break
+            except OSError as e:
+                logging.error(f"Autosave: cannot read {path.name} ({e}), skipping it.")
+        return snapshot, records
+
+    def open(self):
+        """Starts appending (call after recover). Stays disabled if the directory is not writable."""
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            rotated = self._rotated_journals()
+            self._seq = max(self._read_snapshot()[1], rotated[-1][0] if rotated else -1) + 1
+            self._file = open(self.journal_path, 'a', encoding='utf-8')
+        except OSError as e:
+            self._disable(f"opening {self._dir}", e)
+
+    def append(self, kind: str, key, value, deleted: bool = False) -> bool:
+        """
+        Appends one record (flushed to the OS, fsynced by sync()).
+        Returns True when the journal is due for compaction.
+        """
+        if self._file is None:
+            return False
+        record = {"kind": kind, "key": key, "value": value}
+        if deleted:
+            record["deleted"] = True
+        try:
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+        except OSError as e:
+            self._disable("writing the journal", e)
+            return False
+        self._unsynced = True
+        self._records += 1
+        return self._records >= self._compact_every
+
+    def sync(self):
+        """fsyncs pending records. Cheap when nothing was appended."""
+        if self._file is not None and self._unsynced:
+            try:
+                os.fsync(self._file.fileno())
+            except OSError as e:
+                self._disable("syncing the journal", e)
+                return
+            self._unsynced = False
+
+    def write_snapshot(self, snapshot: dict, wait: bool = False):
+        """
+        Compaction: rotates the live journal, then persists `snapshot` (a copy
+        of the state at this point) through the executor, or inline with wait.
+        """
+        self.sync()
+        if self._file is None:
+            return
+        covered = self._seq
+        try:
+            self._file.close()
+            os.replace(self.journal_path, self._dir / f"journal.{covered}.jsonl")
+            self._seq += 1
+            self._file = open(self.journal_path, 'w', encoding='utf-8')
+        except OSError as e:
+            self._disable("rotating the journal", e)
+            return
+        self._records = 0
+
+        if wait or self._executor is None:
+            self._write_snapshot(snapshot, covered)
+        else:
+            self._executor(self._write_snapshot, snapshot, covered)
+
+    def _write_snapshot(self, snapshot: dict, covered: int):
+        """Runs on the executor: snapshot first, then drop the journals it covers."""
+        try:
+            atomic_write_json(self.snapshot_path, {"journal_seq": covered, "state": snapshot})
+        except OSError as e:
+            # The journals stay, recovery still replays them
+            if not self._snapshot_failed:
+                self._snapshot_failed = True
+                logging.error(f"Autosave: writing the snapshot failed ({e}), keeping the journals.")
+            return None
+        for seq, path in self._rotated_journals():
+            if seq <= covered:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass # Replayed again on recovery: harmless
+        return covered
+
+    def close(self):
+        self.sync()
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                logging.error(f"Autosave: closing the journal failed ({e}).")
+            self._file = None
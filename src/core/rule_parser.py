@@ -0,0 +1,269 @@
+"""
+Access rule expression language.
+
+Every entry of a location's "access_rules" list is one alternative (OR).
+Inside an entry:
+    Bomb,Hook             AND (comma, as in the classic rule files)
+    Bomb & Hook           AND
+    Engine | Jade         OR
+    !Jade                 NOT
+    (Hook & Cloud)        grouping
+    2 of [Claire, Lisa, Marie]
+                          at least N of the listed sub-expressions
+                          (inside [...] the comma separates entries, use & for AND)
+
+Parsed rules are tuples:
+    ("item", name) / ("and", children) / ("or", children)
+    ("not", child) / ("atleast", n, children)
+An empty AND (ALWAYS, from an empty item list) always holds.
+"""
+import re
+from functools import reduce
+from itertools import combinations
+from typing import Callable, Optional, Tuple
+
+_OPERATORS = set(",&|!()[]")
+_COUNT_RE = re.compile(r"^(\d+)\s+of$", re.IGNORECASE)
+
+ALWAYS = ("and", ())
+
+
+class RuleSyntaxError(ValueError):
+    """Raised for access rules that cannot be parsed."""
+
+
+def _tokenize(text: str):
+    tokens = []
+    name = []
+    for char in text:
+        if char in _OPERATORS:
+            if "".join(name).strip():
+                tokens.append(("name", "".join(name).strip()))
+            name = []
+            tokens.append(("op", char))
+        else:
+            name.append(char)
+    if "".join(name).strip():
+        tokens.append(("name", "".join(name).strip()))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, op=None):
+        kind, value = self.peek()
+        if op is not None and (kind, value) != ("op", op):
+            raise RuleSyntaxError(f"Expected '{op}' in rule '{self.text}'")
+        self.pos += 1
+        return kind, value
+
+    def parse(self):
+        node = self.parse_or(comma_is_and=True)
+        if self.pos != len(self.tokens):
+            raise RuleSyntaxError(f"Unexpected '{self.peek()[1]}' in rule '{self.text}'")
+        return node
+
+    def parse_or(self, comma_is_and):
+        children = [self.parse_and(comma_is_and)]
+        while self.peek() == ("op", "|"):
+            self.take()
+            children.append(self.parse_and(comma_is_and))
+        return children[0] if len(children) == 1 else ("or", tuple(children))
+
+    def parse_and(self, comma_is_and):
+        children = [self.parse_unary(comma_is_and)]
+        while self.peek() == ("op", "&") or (comma_is_and and self.peek() == ("op", ",")):
+            self.take()
+            children.append(self.parse_unary(comma_is_and))
+        return children[0] if len(children) == 1 else ("and", tuple(children))
+
+    def parse_unary(self, comma_is_and):
+        if self.peek() == ("op", "!"):
+            self.take()
+            return ("not", self.parse_unary(comma_is_and))
+        return self.parse_primary()
+
+    def parse_primary(self):
+        kind, value = self.peek()
+        if (kind, value) == ("op", "("):
+            self.take()
+            node = self.parse_or(comma_is_and=True)
+            self.take(")")
+            return node
+
+        if kind == "name":
+            self.take()
+            count = _COUNT_RE.match(value)
+            if count and self.peek() == ("op", "["):
+                return self.parse_count(int(count.group(1)))
+            return ("item", value)
+
+        # Nothing between commas ("Bomb,,Hook", "Bomb," or ""). The classic
+        # split(',') treated this as an item named "", keep that.
+        previous = self.tokens[self.pos - 1] if self.pos else (None, None)
+        if previous in ((None, None), ("op", ",")) and (kind is None or value == ","):
+            return ("item", "")
+        if kind is None:
+            raise RuleSyntaxError(f"Missing operand after '{previous[1]}' in rule '{self.text}'")
+        raise RuleSyntaxError(f"Unexpected '{value}' in rule '{self.text}'")
+
+    def parse_count(self, count):
+        self.take("[")
+        children = [self.parse_or(comma_is_and=False)]
+        while self.peek() == ("op", ","):
+            self.take()
+            children.append(self.parse_or(comma_is_and=False))
+        self.take("]")
+        if count > len(children):
+            raise RuleSyntaxError(f"'{count} of' needs at least {count} entries in rule '{self.text}'")
+        return ("atleast", count, tuple(children))
+
+
+def parse_rule(rule) -> tuple:
+    """Parses one access rule (string, or a list of items meaning AND)."""
+    if isinstance(rule, list):
+        items = tuple(("item", str(item).strip()) for item in rule)
+        return items[0] if len(items) == 1 else ("and", items) # [] -> ALWAYS
+    return _Parser(str(rule)).parse()
+
+
+def rule_items(node) -> Tuple[str, ...]:
+    """Item names in order of first appearance."""
+    names = {}
+
+    def visit(n):
+        if n[0] == "item":
+            names.setdefault(n[1])
+        elif n[0] == "not":
+            visit(n[1])
+        else:
+            for child in n[-1]:
+                visit(child)
+
+    visit(node)
+    return tuple(names)
+
+
+def is_monotone(node) -> bool:
+    """True when obtaining more items can never make the rule fail (no negation)."""
+    if node[0] == "item":
+        return True
+    if node[0] == "not":
+        return False
+    return all(is_monotone(child) for child in node[-1])
+
+
+def _minimize(masks):
+    """Removes masks that are supersets of another mask (absorbed alternatives)."""
+    unique = sorted(set(masks), key=lambda m: bin(m).count("1"))
+    kept = []
+    for mask in unique:
+        if not any(other & mask == other for other in kept):
+            kept.append(mask)
+    return kept
+
+
+def to_masks(node, bit_of: Callable[[str], int], limit: int = 64) -> Optional[Tuple[int, ...]]:
+    """
+    Expands a monotone rule into OR-of-AND masks (disjunctive normal form).
+    Returns None when the rule is not monotone or needs more than `limit` masks.
+    """
+    if not is_monotone(node):
+        return None
+
+    def expand(n):
+        kind = n[0]
+        if kind == "item":
+            return [bit_of(n[1])]
+        if kind == "or":
+            masks = []
+            for child in n[1]:
+                masks.extend(expand(child))
+        elif kind == "and":
+            masks = [0]
+            for child in n[1]:
+                masks = [left | right for left in masks for right in expand(child)]
+                if len(masks) > limit * limit:
+                    raise OverflowError
+        else: # atleast
+            count, children = n[1], n[2]
+            masks = []
+            for group in combinations(children, count):
+                masks.extend(expand(("and", group)))
+                if len(masks) > limit * limit:
+                    raise OverflowError
+        masks = _minimize(masks)
+        if len(masks) > limit:
+            raise OverflowError
+        return masks
+
+    try:
+        return tuple(expand(node))
+    except OverflowError:
+        return None
+
+
+def compile_rule(node, bit_of: Callable[[str], int]) -> Callable[[int], bool]:
+    """Compiles a rule into a closure evaluating an inventory bitmask."""
+    kind = node[0]
+
+    if kind == "item":
+        bit = bit_of(node[1])
+        return lambda mask: mask & bit != 0
+
+    if kind == "not":
+        inner = compile_rule(node[1], bit_of)
+        return lambda mask: not inner(mask)
+
+    children = node[-1]
+    # Plain item lists collapse into single bitmask tests
+    if all(child[0] == "item" for child in children):
+        bits = tuple(bit_of(child[1]) for child in children)
+        combined = 0
+        for bit in bits:
+            combined |= bit
+        if kind == "and":
+            return lambda mask: mask & combined == combined
+        if kind == "or":
+            return lambda mask: mask & combined != 0
+        count = node[1]
+        if len(set(bits)) < len(bits):
+            # A listed duplicate counts once per entry, like the mask and column paths
+            return lambda mask: sum(1 for bit in bits if mask & bit) >= count
+        return lambda mask: bin(mask & combined).count("1") >= count
+
+    funcs = tuple(compile_rule(child, bit_of) for child in children)
+    if kind == "and":
+        return lambda mask: all(f(mask) for f in funcs)
+    if kind == "or":
+        return lambda mask: any(f(mask) for f in funcs)
+    count = node[1]
+    return lambda mask: sum(1 for f in funcs if f(mask)) >= count
+
+
+def evaluate_columns(node, column_of):
+    """
+    Evaluates a rule over boolean NumPy columns (one entry per inventory).
+    column_of(name) returns the column of an item.
+    """
+    kind = node[0]
+    if kind == "item":
+        return column_of(node[1])
+    if kind == "not":
+        return ~evaluate_columns(node[1], column_of)
+
+    columns = [evaluate_columns(child, column_of) for child in node[-1]]
+    if not columns:
+        return True # ALWAYS (broadcasts over the inventories)
+    if kind == "and":
+        return reduce(lambda a, b: a & b, columns)
+    if kind == "or":
+        return reduce(lambda a, b: a | b, columns)
+    return sum(column.astype(int) for column in columns) >= node[1]
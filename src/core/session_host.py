@@ -0,0 +1,58 @@
+"""
+Several independent tracker states over one shared static dataset
+(e.g. a restream following four racers of the same seed).
+
+    host = SessionHost()
+    alice = host.add_session("Alice")
+    bob = host.add_session("Bob")
+
+The static data is read once (DataLoader.preload) and the rules are
+compiled once (LogicEngine). Every session only owns its StateManager
+plus a LogicEngine.session() view holding its tracked inventory; the
+compiled tables and inventory-keyed memos are shared.
+"""
+import logging
+from typing import Dict, Optional
+from core.data_loader import DataLoader
+from core.logic_engine import LogicEngine
+from core.state_manager import StateManager
+
+
+class SessionHost:
+
+    def __init__(self, data_loader: Optional[DataLoader] = None):
+        self.data_loader = (data_loader or DataLoader()).preload()
+        self.logic_engine = LogicEngine(self.data_loader)
+        self._sessions: Dict[str, StateManager] = {}
+
+    @property
+    def sessions(self) -> Dict[str, StateManager]:
+        """{name: StateManager} in creation order (copy)."""
+        return dict(self._sessions)
+
+    def add_session(self, name: str) -> StateManager:
+        if name in self._sessions:
+            raise ValueError(f"Session already exists: {name}")
+        shared = next(iter(self._sessions.values()), None)
+        state_manager = StateManager(self.logic_engine.session(), share_static_from=shared)
+        self._sessions[name] = state_manager
+        logging.info(f"SessionHost: added session '{name}' ({len(self._sessions)} total).")
+        return state_manager
+
+    def remove_session(self, name: str):
+        state_manager = self._sessions.pop(name)
+        state_manager.close_autosave()
+
+    def reload_changed(self):
+        """Hot reload: re-reads changed data files once and updates every session."""
+        changed = self.data_loader.reload_changed()
+        if changed:
+            for state_manager in self._sessions.values():
+                state_manager.reload_data(changed)
+        return changed
+
+    def get_session(self, name: str) -> Optional[StateManager]:
+        return self._sessions.get(name)
+
+    def __len__(self):
+        return len(self._sessions)
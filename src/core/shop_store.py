@@ -0,0 +1,97 @@
+"""
+Shop item store.
+
+Entries are (location, item_name) pairs kept in insertion order. Add, remove
+and membership are O(1) (dict keys); per-location and per-item indexes give
+the sorted/filtered views without scanning every entry.
+"""
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+ShopKey = Tuple[str, str]  # (location, item_name)
+
+
+class ShopStore:
+    def __init__(self, entries: Iterable[ShopKey] = ()):
+        self._entries: Dict[ShopKey, None] = {}
+        self._by_location: Dict[str, Dict[str, None]] = {}
+        self._by_item: Dict[str, Dict[str, None]] = {}
+        for location, item_name in entries:
+            self.add(location, item_name)
+
+    @classmethod
+    def from_list(cls, entries: List[dict]) -> "ShopStore":
+        """Builds a store from the saved [{location, name}] list."""
+        return cls((e['location'], e['name']) for e in entries)
+
+    def to_list(self) -> List[dict]:
+        """[{location, name}] in insertion order (save file format)."""
+        return [{'location': location, 'name': item_name} for location, item_name in self._entries]
+
+    # --- Mutation ---
+
+    def add(self, location: str, item_name: str) -> bool:
+        """Returns False if the entry already exists."""
+        key = (location, item_name)
+        if key in self._entries:
+            return False
+        self._entries[key] = None
+        self._by_location.setdefault(location, {})[item_name] = None
+        self._by_item.setdefault(item_name, {})[location] = None
+        return True
+
+    def remove(self, location: str, item_name: str) -> bool:
+        """Returns False if the entry did not exist."""
+        key = (location, item_name)
+        if key not in self._entries:
+            return False
+        del self._entries[key]
+        self._discard(self._by_location, location, item_name)
+        self._discard(self._by_item, item_name, location)
+        return True
+
+    def clear(self):
+        self._entries.clear()
+        self._by_location.clear()
+        self._by_item.clear()
+
+    @staticmethod
+    def _discard(index, outer, inner):
+        bucket = index[outer]
+        del bucket[inner]
+        if not bucket:
+            del index[outer]
+
+    # --- Queries ---
+
+    def __contains__(self, key: ShopKey) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ShopKey]:
+        return iter(self._entries)
+
+    def items_at(self, location: str) -> Tuple[str, ...]:
+        """Items logged for a location, in insertion order."""
+        return tuple(self._by_location.get(location, ()))
+
+    def locations_of(self, item_name: str) -> Tuple[str, ...]:
+        """Locations where an item was logged, in insertion order."""
+        return tuple(self._by_item.get(item_name, ()))
+
+    def sorted_by_location(self) -> List[ShopKey]:
+        """Entries grouped by location (alphabetical), insertion order within a location."""
+        return [
+            (location, item_name)
+            for location in sorted(self._by_location)
+            for item_name in self._by_location[location]
+        ]
+
+    def sorted_by_item(self) -> List[ShopKey]:
+        """Entries grouped by item (alphabetical), insertion order within an item."""
+        return [
+            (location, item_name)
+            for item_name in sorted(self._by_item)
+            for location in self._by_item[item_name]
+        ]
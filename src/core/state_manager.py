@@ -1,44 +1,137 @@
-from PyQt6.QtCore import QObject, pyqtSignal, QPointF
-import json
 import logging
-from typing import Dict, Any, Optional
+import re
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Mapping, NamedTuple, Tuple
+from core.events import Signal
+from core.persistence import read_state_file, write_state_file
+from core.shop_store import ShopStore
+from core.undo_journal import UndoJournal, MISSING
+from utils.constants import GOAL_LOCATION
 
-class StateManager(QObject):
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def _location_key(name: str) -> str:
+    """Case, punctuation and whitespace insensitive lookup key ("Daos' Shrine" -> "daosshrine")."""
+    return _NON_ALNUM.sub("", name.casefold())
+
+
+class StateChangeSet(NamedTuple):
+    """Everything that changed inside one StateManager.batch() block."""
+    inventory_changed: bool
+    locations: Dict[str, str]                  # name -> last emitted state
+    characters: Dict[str, bool]                # name -> last obtained flag
+    assignments: Tuple[Tuple[str, str, str], ...] # ("assigned"/"unassigned", location, character) in order
+    shop_items_changed: bool
+    hints_changed: bool
+    reset: bool
+    replaced: bool                             # State was swapped wholesale (load), repaint everything
+
+
+class StateDelta(NamedTuple):
+    """Typed change notification: only the entries that actually changed."""
+    version: int                       # StateManager.state_version after the change
+    items_added: Tuple[str, ...]       # Became obtained in the effective inventory
+    items_removed: Tuple[str, ...]     # No longer obtained
+    locations: Dict[str, str]          # name -> new effective state
+    replaced: bool = False             # Part of a wholesale swap, changes_committed repaints everything
+
+
+class DataReload(NamedTuple):
+    """Static data hot-reloaded under a running state (StateManager.reload_data)."""
+    files: frozenset      # Data files that changed
+    locations: frozenset  # Locations whose accessibility or rules changed
+
+
+class _PendingSignals:
+    """Signals recorded while a batch is open, merged per key."""
+
+    def __init__(self):
+        self.inventory = False
+        self.locations: Dict[str, str] = {}
+        self.characters: Dict[str, bool] = {}
+        self.assignments = []
+        self.shop_items = False # Whole list replaced
+        self.shop_events = [] # ("added"/"removed", location, item_name) in order
+        self.hints = False
+        self.player_position = None
+        self.reset = False
+        self.replaced = False
+
+    def record(self, name, args):
+        if name == "inventory_changed":
+            self.inventory = True
+        elif name == "location_changed":
+            self.locations.pop(args[0], None) # Keep latest change last
+            self.locations[args[0]] = args[1]
+        elif name == "character_changed":
+            self.characters.pop(args[0], None)
+            self.characters[args[0]] = args[1]
+        elif name == "character_assigned":
+            self.assignments.append(("assigned",) + tuple(args))
+        elif name == "character_unassigned":
+            self.assignments.append(("unassigned",) + tuple(args))
+        elif name == "shop_items_changed":
+            self.shop_items = True
+        elif name == "shop_item_added":
+            self.shop_events.append(("added",) + tuple(args))
+        elif name == "shop_item_removed":
+            self.shop_events.append(("removed",) + tuple(args))
+        elif name == "hints_changed":
+            self.hints = True
+        elif name == "player_position_changed":
+            self.player_position = args
+        elif name == "reset_occurred":
+            self.reset = True
+
+class StateManager:
     """
     Central repository for the application state.
     Handles manual overrides and toroidal world logic.
+    Qt-free (core.events signals); the GUI wraps it in gui.qt_state.QtStateManager.
     """
     
     # Signals for UI updates
-    inventory_changed = pyqtSignal(dict)  # Emits full inventory dict
-    location_changed = pyqtSignal(str, str)  # location_name, new_state (red/green/grey)
-    player_position_changed = pyqtSignal(float, float)  # x, y (canvas coordinates)
-    character_changed = pyqtSignal(str, bool)  # name, is_obtained
-    character_assigned = pyqtSignal(str, str) # location, character_name
-    character_unassigned = pyqtSignal(str, str) # location, character_name
+    inventory_changed = Signal(object)  # Emits full (read-only) inventory mapping
+    location_changed = Signal(str, str)  # location_name, new_state (red/green/grey)
+    player_position_changed = Signal(float, float)  # x, y (canvas coordinates)
+    character_changed = Signal(str, bool)  # name, is_obtained
+    character_assigned = Signal(str, str) # location, character_name
+    character_unassigned = Signal(str, str) # location, character_name
+    
+    reset_occurred = Signal() # New signal for global reset
     
-    reset_occurred = pyqtSignal() # New signal for global reset
+    shop_items_changed = Signal(list) # Whole list replaced (load/reset): [{location, name}]
+    shop_item_added = Signal(str, str) # location, item_name
+    shop_item_removed = Signal(str, str) # location, item_name
+    hints_changed = Signal(str)
     
-    shop_items_changed = pyqtSignal(list) # List of {location, name} dictionaries
-    hints_changed = pyqtSignal(str)
+    changes_committed = Signal(object) # StateChangeSet, once per outermost batch() (or unbatched change)
+    state_delta = Signal(object) # StateDelta for every inventory/location change (merged per batch)
+    data_reloaded = Signal(object) # DataReload after a static data hot reload (state untouched)
     
-    def __init__(self, logic_engine):
-        super().__init__()
+    def __init__(self, logic_engine, share_static_from: Optional["StateManager"] = None):
+        # share_static_from: another StateManager over the same data whose
+        # read-only lookup tables are reused (see core.session_host)
         self.logic_engine = logic_engine
         
         # --- Internal State ---
         self._inventory: Dict[str, bool] = {}
         self._locations: Dict[str, str] = {}  # name -> state
         self._characters: Dict[str, bool] = {}
-        self._character_locations: Dict[str, str] = {}
+        self._character_locations: Dict[str, str] = {} # location -> character
+        self._location_of_character: Dict[str, str] = {} # character -> location (reverse index)
         self._active_party = set()
         self._active_party_list = [] # Ordered list for Sprite Display
         self._obtained_capsules = set()
-        self._player_pos = QPointF(0, 0)
+        self._player_pos = (0.0, 0.0)
         self._game_world_size = (4096, 4096)  # Standard SNES Map Size
         self._canvas_size = (400, 400)        # Fixed Canvas Size
-        self.shop_items = [] # List of {location, name}
+        self._shop = ShopStore() # (location, item_name) entries in insertion order
         self.hints_text = ""
+        self._spoiler_placements: Dict[str, str] = {} # location -> item/character from spoiler log
         
         # --- Overrides ---
         # If a user manually clicks something, it gets locked here.
@@ -46,97 +139,388 @@ class StateManager(QObject):
         self._manual_location_overrides: Dict[str, str] = {}
         self._manual_character_overrides: Dict[str, bool] = {}
         
-        # --- Load Location Mapping ---
-        try:
-             import os
-             import sys
-             
-             # Robust path finding
-             if getattr(sys, 'frozen', False):
-                 base_path = sys._MEIPASS
-                 mapping_path = os.path.join(base_path, "src", "data", "location_name_mapping.json")
-             else:
-                 # Calculate path relative to this file (src/core/state_manager.py) -> src/data is up one level then down
-                 # current_dir = src/core
-                 current_dir = os.path.dirname(os.path.abspath(__file__))
-                 # up one level -> src
-                 src_dir = os.path.dirname(current_dir)
-                 mapping_path = os.path.join(src_dir, "data", "location_name_mapping.json")
-
-             with open(mapping_path, 'r') as f:
-                 self._location_mapping = json.load(f)
-             logging.info(f"Loaded {len(self._location_mapping)} location mappings.")
-        except Exception as e:
-            logging.error(f"Failed to load location mapping: {e}")
-            self._location_mapping = {}
+        # --- Effective Views ---
+        # Materialized raw+override merges, rebuilt only after a change.
+        self._state_version = 0
+        self._inventory_view: Mapping[str, bool] = MappingProxyType({})
+        self._locations_view: Mapping[str, str] = MappingProxyType({})
+        self._inventory_dirty = True
+        self._locations_dirty = True
+        
+        # --- Deltas ---
+        # Inventory view the last StateDelta was computed against, and the items
+        # touched since then (None: unknown, diff all keys).
+        self._delta_base: Mapping[str, bool] = MappingProxyType({})
+        self._touched_items: Optional[set] = set()
+        
+        # --- Undo/Redo ---
+        self._journal = UndoJournal()
+        
+        # --- Autosave (AutosaveJournal, attached by recover_autosave) ---
+        self._autosave = None
+        self._autosave_compaction_due = False # Deferred to sync_autosave (timer)
+        
+        # --- Batching ---
+        self._batch_depth = 0
+        self._pending: Optional[_PendingSignals] = None
+        
+        # --- Location Name Index ---
+        if share_static_from is not None:
+            self._spoiler_to_internal = share_static_from._spoiler_to_internal
+            self._location_keys = share_static_from._location_keys
+        else:
+            self._build_location_index(self.data_loader.get_location_name_mapping())
+
+    @property
+    def data_loader(self):
+        return self.logic_engine.data_loader
+
+    def _build_location_index(self, mapping: Dict[str, str]):
+        """
+        Inverts location_name_mapping.json ({internal: spoiler}) once.
+        The first internal name listed for a spoiler name wins (v1.3 parity).
+        A second table keyed by _location_key() serves the fuzzy fallback.
+        """
+        self._spoiler_to_internal: Dict[str, str] = {}
+        self._location_keys: Dict[str, str] = {}
+        for internal_name, spoiler_name in mapping.items():
+            self._spoiler_to_internal.setdefault(spoiler_name, internal_name)
+            self._location_keys.setdefault(_location_key(spoiler_name), internal_name)
+        # Internal names written slightly differently also resolve to themselves
+        for internal_name in mapping:
+            self._location_keys.setdefault(_location_key(internal_name), internal_name)
+        logging.info(f"Loaded {len(mapping)} location mappings.")
+
+    def reload_data(self, filenames):
+        """
+        Rebuilds what depends on static data files the DataLoader just reloaded
+        (DataLoader.reload_changed) and announces the locations to re-evaluate.
+        The tracker state (inventory, overrides, assignments...) is kept as is.
+        """
+        filenames = frozenset(filenames)
+        if "location_name_mapping.json" in filenames:
+            self._build_location_index(self.data_loader.get_location_name_mapping())
+        locations = set()
+        if filenames & self.logic_engine.LOGIC_FILES:
+            locations = self.logic_engine.reload(self.inventory, reread=False)
+        self.data_reloaded.emit(DataReload(filenames, frozenset(locations)))
 
     def _normalize_location_name(self, raw_loc):
         """
-        Normalize location name from spoiler log using loaded mapping.
-        Replicates v1.3 Logic: Linear search to find FIRST matching internal name.
+        Normalize location name from spoiler log using the prebuilt index.
+        Exact spoiler names first, then a case/punctuation/whitespace
+        insensitive match. Unknown names are returned unchanged.
         """
         if not raw_loc:
             return "Unknown"
             
-        # Linear search for FIRST match (Value == raw_loc)
-        for internal_name, spoiler_name in self._location_mapping.items():
-            if spoiler_name == raw_loc:
-                return internal_name
-                
-        return raw_loc
+        internal_name = self._spoiler_to_internal.get(raw_loc)
+        if internal_name is None:
+            internal_name = self._location_keys.get(_location_key(raw_loc))
+        return internal_name if internal_name is not None else raw_loc
         
+    # --- Batching ---
+
+    @contextmanager
+    def batch(self):
+        """
+        Defers signals until the outermost block exits, then emits each changed
+        entry once (inventory_changed at most once) followed by changes_committed.
+
+            with state_manager.batch():
+                ...
+        """
+        if self._batch_depth == 0:
+            self._pending = _PendingSignals()
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending, self._pending = self._pending, None
+                self._flush(pending)
+
+    def _emit(self, name: str, *args):
+        """
+        Records a state signal for the open batch. Outside a batch it is
+        flushed right away as a one-signal batch, so every change ends with a
+        changes_committed.
+        """
+        if self._batch_depth:
+            self._pending.record(name, args)
+            return
+        with self.batch():
+            self._pending.record(name, args)
+
+    def _emit_delta(self, locations: Dict[str, str], replaced: bool = False):
+        """Emits state_delta for the touched items since the last delta plus `locations`."""
+        old, new = self._delta_base, self.inventory
+        touched = self._touched_items
+        keys = old.keys() | new.keys() if touched is None else touched
+        added = tuple(k for k in keys if new.get(k, False) and not old.get(k, False))
+        removed = tuple(k for k in keys if old.get(k, False) and not new.get(k, False))
+        self._delta_base = new
+        self._touched_items = set()
+        
+        if added or removed or locations:
+            self.state_delta.emit(StateDelta(self._state_version, added, removed, locations, replaced))
+
+    def _flush(self, pending: _PendingSignals):
+        # Reset first so widgets clear before the new state is pushed
+        if pending.reset:
+            self.reset_occurred.emit()
+        for event, location, name in pending.assignments:
+            if event == "assigned":
+                self.character_assigned.emit(location, name)
+            else:
+                self.character_unassigned.emit(location, name)
+        for name, obtained in pending.characters.items():
+            self.character_changed.emit(name, obtained)
+        for name, state in pending.locations.items():
+            self.location_changed.emit(name, state)
+        if pending.inventory:
+            self.inventory_changed.emit(self.inventory)
+        if pending.shop_items:
+            self.shop_items_changed.emit(self.shop_items)
+        else:
+            for event, location, item_name in pending.shop_events:
+                if event == "added":
+                    self.shop_item_added.emit(location, item_name)
+                else:
+                    self.shop_item_removed.emit(location, item_name)
+        if pending.hints:
+            self.hints_changed.emit(self.hints_text)
+        if pending.player_position is not None:
+            self.player_position_changed.emit(*pending.player_position)
+        if pending.inventory or pending.locations:
+            self._emit_delta(dict(pending.locations), pending.replaced)
+
+        self.changes_committed.emit(StateChangeSet(
+            inventory_changed=pending.inventory,
+            locations=pending.locations,
+            characters=pending.characters,
+            assignments=tuple(pending.assignments),
+            shop_items_changed=pending.shop_items or bool(pending.shop_events),
+            hints_changed=pending.hints,
+            reset=pending.reset,
+            replaced=pending.replaced,
+        ))
+
+    # --- Effective View Maintenance ---
+
+    def _invalidate_inventory(self, item: Optional[str] = None):
+        """
+        Call after changing _inventory or _manual_inventory_overrides.
+        Pass the item when only one entry changed (keeps the next delta O(1)).
+        """
+        self._inventory_dirty = True
+        self._state_version += 1
+        if item is None:
+            self._touched_items = None
+        elif self._touched_items is not None:
+            self._touched_items.add(item)
+
+    def _invalidate_locations(self):
+        """Call after changing _locations or _manual_location_overrides."""
+        self._locations_dirty = True
+        self._state_version += 1
+
+    @property
+    def state_version(self) -> int:
+        """Increments on every inventory/location change."""
+        return self._state_version
+
     # --- Public Accessors ---
     
-    def get_inventory(self) -> Dict[str, bool]:
+    def get_inventory(self) -> Mapping[str, bool]:
         """Explicit getter for inventory."""
-        effective = self._inventory.copy()
-        effective.update(self._manual_inventory_overrides)
-        return effective
+        if self._inventory_dirty:
+            effective = self._inventory.copy()
+            effective.update(self._manual_inventory_overrides)
+            self._inventory_view = MappingProxyType(effective)
+            self._inventory_dirty = False
+        return self._inventory_view
 
     @property
-    def inventory(self) -> Dict[str, bool]:
-        """Returns effective inventory (actual + overrides)."""
+    def inventory(self) -> Mapping[str, bool]:
+        """Returns effective inventory (actual + overrides) as a read-only mapping."""
         return self.get_inventory()
 
     @property
-    def locations(self) -> Dict[str, str]:
-        """Returns effective location states."""
-        effective = self._locations.copy()
-        effective.update(self._manual_location_overrides)
-        return effective
+    def locations(self) -> Mapping[str, str]:
+        """Returns effective location states as a read-only mapping."""
+        if self._locations_dirty:
+            effective = self._locations.copy()
+            effective.update(self._manual_location_overrides)
+            self._locations_view = MappingProxyType(effective)
+            self._locations_dirty = False
+        return self._locations_view
         
-    def get_player_position(self) -> QPointF:
+    def get_player_position(self) -> Tuple[float, float]:
         """Returns current player position (canvas coordinates)."""
         return self._player_pos
 
+    # --- Journaled Changes ---
+    # Every user-facing mutation goes through _write so it can be undone.
+    # kinds: "inventory" / "location" (manual overrides), "character" (obtained),
+    #        "character_location" (location -> character), "party" (character -> True if active),
+    #        "shop" ((location, item) -> True)
+
+    @contextmanager
+    def _undoable(self):
+        """Groups all writes inside into one undo step (nested blocks join the outer one)."""
+        self._journal.begin()
+        try:
+            yield
+        finally:
+            self._journal.end()
+
+    def _current(self, kind: str, key):
+        if kind == "inventory":
+            return self._manual_inventory_overrides.get(key, MISSING)
+        if kind == "location":
+            return self._manual_location_overrides.get(key, MISSING)
+        if kind == "character":
+            return self._characters.get(key, MISSING)
+        if kind == "character_location":
+            return self._character_locations.get(key, MISSING)
+        if kind == "party":
+            return True if key in self._active_party else MISSING
+        return True if key in self._shop else MISSING
+
+    def _write(self, kind: str, key, value):
+        """Applies one entry change (MISSING removes it) and journals the previous value."""
+        before = self._current(kind, key)
+        if before is not value and before != value:
+            self._journal.record(kind, key, before, value)
+        self._apply_change(kind, key, value)
+
+    def _apply_change(self, kind: str, key, value):
+        """Sets or removes one entry and emits the matching signal (no journaling)."""
+        if kind == "inventory":
+            if value is MISSING:
+                self._manual_inventory_overrides.pop(key, None)
+            else:
+                self._manual_inventory_overrides[key] = value
+            self._invalidate_inventory(key)
+            self._emit("inventory_changed", self.inventory)
+
+        elif kind == "location":
+            if value is MISSING:
+                self._manual_location_overrides.pop(key, None)
+            else:
+                self._manual_location_overrides[key] = value
+            self._invalidate_locations()
+            # "" = no state left, the dot falls back to its logic color
+            self._emit("location_changed", key, self.locations.get(key, ""))
+
+        elif kind == "character":
+            if value is MISSING:
+                self._characters.pop(key, None)
+            else:
+                self._characters[key] = value
+            self._emit("character_changed", key, value is not MISSING and bool(value))
+
+        elif kind == "character_location":
+            before = self._unlink_location(key)
+            if before:
+                self._emit("character_unassigned", key, before)
+            if value is not MISSING:
+                self._link_character(key, value)
+                self._emit("character_assigned", key, value)
+
+        elif kind == "party":
+            if value is MISSING:
+                self._active_party.discard(key)
+            else:
+                self._active_party.add(key)
+            self._emit("character_changed", key, self._characters.get(key, False))
+
+        elif kind == "shop":
+            location, item_name = key
+            if value is MISSING:
+                if self._shop.remove(location, item_name):
+                    self._emit("shop_item_removed", location, item_name)
+            elif self._shop.add(location, item_name):
+                self._emit("shop_item_added", location, item_name)
+
+        self._autosave_record(kind, key, value)
+
+    def undo(self) -> bool:
+        """Reverts the last user action. Returns False when there is nothing to undo."""
+        group = self._journal.pop_undo()
+        if group is None:
+            return False
+        self._replay((kind, key, before) for kind, key, before, _ in reversed(group))
+        logging.info(f"Undo: {len(group)} change(s)")
+        return True
+
+    def redo(self) -> bool:
+        """Re-applies the last undone action. Returns False when there is nothing to redo."""
+        group = self._journal.pop_redo()
+        if group is None:
+            return False
+        self._replay((kind, key, after) for kind, key, _, after in group)
+        logging.info(f"Redo: {len(group)} change(s)")
+        return True
+
+    def _replay(self, changes):
+        self._journal.suspend()
+        try:
+            with self.batch():
+                for kind, key, value in changes:
+                    self._apply_change(kind, key, value)
+        finally:
+            self._journal.resume()
+
+    def can_undo(self) -> bool:
+        return self._journal.can_undo()
+
+    def can_redo(self) -> bool:
+        return self._journal.can_redo()
+
     # --- Manual Interactions (High Priority) ---
     
     def set_manual_location_state(self, name: str, state: str):
         """User manually clicked a location dot."""
-        self._manual_location_overrides[name] = state
-        self.location_changed.emit(name, state)
+        with self._undoable():
+            self._write("location", name, state)
         logging.info(f"Manual override: Location {name} -> {state}")
 
     def toggle_manual_inventory(self, item_name: str):
         """User clicked an item icon."""
         current = self.inventory.get(item_name, False)
         new_state = not current
-        self._manual_inventory_overrides[item_name] = new_state
-        self.inventory_changed.emit(self.inventory)
+        with self._undoable():
+            self._write("inventory", item_name, new_state)
         logging.info(f"Manual override: Item {item_name} -> {new_state}")
 
     def reset_overrides(self):
         """Clears all manual overrides, reverting to raw external data."""
-        self._manual_inventory_overrides.clear()
-        self._manual_location_overrides.clear()
-        self._manual_character_overrides.clear()
+        self._journal.clear()
+        with self.batch():
+            dropped_locations = list(self._manual_location_overrides)
+            dropped_characters = list(self._manual_character_overrides)
+            self._manual_inventory_overrides.clear()
+            self._manual_location_overrides.clear()
+            self._manual_character_overrides.clear()
+            self._invalidate_inventory()
+            self._invalidate_locations()
         
-        # Re-emit everything to sync UI
-        self.inventory_changed.emit(self._inventory)
-        for loc, state in self._locations.items():
-            self.location_changed.emit(loc, state)
-        # TODO: emit characters
+            # Re-emit everything to sync UI
+            self._emit("inventory_changed", self.inventory)
+            for loc, state in self._locations.items():
+                self._emit("location_changed", loc, state)
+            # Overrides without raw data: "" = back to the logic color
+            for loc in dropped_locations:
+                if loc not in self._locations:
+                    self._emit("location_changed", loc, "")
+            obtained = self.obtained_characters
+            for name in dropped_characters:
+                self._emit("character_changed", name, obtained.get(name, False))
         
+        self._autosave_snapshot()
         logging.info("Manual overrides reset.")
 
     # --- External Data Updates (Low Priority) ---
@@ -155,7 +539,7 @@ class StateManager(QObject):
         canvas_x = game_x * scale_x
         canvas_y = game_y * scale_y
         
-        self._player_pos = QPointF(canvas_x, canvas_y)
+        self._player_pos = (canvas_x, canvas_y)
 
 
     @property
@@ -174,114 +558,165 @@ class StateManager(QObject):
              return self._active_party_list[0]
         return None
         
+    # --- Character <-> Location Index ---
+    # _character_locations and _location_of_character are only changed through
+    # _link_character/_unlink_location/_rebuild_character_index.
+
+    def _link_character(self, location: str, character_name: str):
+        self._unlink_location(location)
+        self._character_locations[location] = character_name
+        self._location_of_character[character_name] = location
+
+    def _unlink_location(self, location: str) -> Optional[str]:
+        """Removes the assignment at a location, returns the character that was there."""
+        character_name = self._character_locations.pop(location, None)
+        if character_name and self._location_of_character.get(character_name) == location:
+            del self._location_of_character[character_name]
+        return character_name
+
+    def _rebuild_character_index(self, assignments: Dict[str, str]):
+        self._character_locations = dict(assignments)
+        self._location_of_character = {char: loc for loc, char in assignments.items()}
+
     def get_character_at_location(self, location_name: str) -> Optional[str]:
         return self._character_locations.get(location_name)
 
+    def get_location_of_character(self, character_name: str) -> Optional[str]:
+        """Location the character is assigned to, or None."""
+        return self._location_of_character.get(character_name)
+
+    def is_character_assigned(self, character_name: str) -> bool:
+        return character_name in self._location_of_character
+
     def set_character_obtained(self, name: str, obtained: bool):
-        self._characters[name] = obtained
-        self.character_changed.emit(name, obtained)
+        with self._undoable():
+            self._write("character", name, obtained)
+
+    def set_character_active(self, name: str, active: bool):
+        """Adds/removes a character from the active party."""
+        with self._undoable():
+            self._write("party", name, True if active else MISSING)
+
+    def set_character_status(self, name: str, obtained: bool, active: bool):
+        """Obtained + party membership as one undo step (roster click)."""
+        with self._undoable():
+            self.set_character_obtained(name, obtained)
+            self.set_character_active(name, active)
         
     def assign_character_to_location(self, location: str, character_name: str):
         # 0. Prevent Redundant Updates
         if self._character_locations.get(location) == character_name:
             return
 
-        # 1. Check if character is already assigned elsewhere (Move)
-        prev_loc = None
-        for loc, name in self._character_locations.items():
-            if name == character_name:
-                prev_loc = loc
-                break
-        
-        if prev_loc:
-             # Remove from old location, but keep obtained status (moving)
-             # Just emit unassign so map sprite is removed
-             del self._character_locations[prev_loc]
-             self.character_unassigned.emit(prev_loc, character_name)
-
-        # 2. Check if location already has someone (Overwrite)
-        old_char = self._character_locations.get(location)
-        if old_char and old_char != character_name:
-             # User says: "Previous character needs to be dimmed" (Reset)
-             self.set_character_obtained(old_char, False)
-             self.character_unassigned.emit(location, old_char)
-             
-        # 3. Assign
-        self._character_locations[location] = character_name
-        self.set_character_obtained(character_name, True)
-        
-        # 4. Mark Location as "Cleared"
-        self.set_manual_location_state(location, "cleared")
-        
-        # Emit signal for MapWidget
-        self.character_assigned.emit(location, character_name)
+        with self._undoable():
+            # 1. Check if character is already assigned elsewhere (Move)
+            prev_loc = self._location_of_character.get(character_name)
+            if prev_loc:
+                 # Remove from old location, but keep obtained status (moving)
+                 # Unassign signal removes the map sprite
+                 self._write("character_location", prev_loc, MISSING)
+
+            # 2. Check if location already has someone (Overwrite)
+            old_char = self._character_locations.get(location)
+            if old_char and old_char != character_name:
+                 # User says: "Previous character needs to be dimmed" (Reset)
+                 self.set_character_obtained(old_char, False)
+                 
+            # 3. Assign (emits unassign for the previous occupant, then assign for MapWidget)
+            self._write("character_location", location, character_name)
+            self.set_character_obtained(character_name, True)
+            
+            # 4. Mark Location as "Cleared"
+            self.set_manual_location_state(location, "cleared")
         
     def remove_character_assignment(self, location: str):
-        char = self._character_locations.pop(location, None)
+        char = self._character_locations.get(location)
         if char:
             # Logic Parity v1.3: "Removes from inactive but obtained roster"
             # Since inactive roster = obtained=True but not in Active Party,
             # we set obtained=False.
-            self.set_character_obtained(char, False)
-            self.character_unassigned.emit(location, char)
+            with self._undoable():
+                self._write("character_location", location, MISSING)
+                self.set_character_obtained(char, False)
             logging.info(f"StateManager: Removed {char} from {location} and set to Not Obtained.")
 
     def register_shop_item(self, location, item_name):
         # Check duplicate
-        for entry in self.shop_items:
-            if entry['location'] == location and entry['name'] == item_name:
-                return
-        self.shop_items.append({'location': location, 'name': item_name})
-        self.shop_items_changed.emit(self.shop_items)
+        if self._current("shop", (location, item_name)) is not MISSING:
+            return
+        with self._undoable():
+            self._write("shop", (location, item_name), True)
         
     def unregister_shop_item(self, location, item_name):
-        self.shop_items = [e for e in self.shop_items if not (e['location'] == location and e['name'] == item_name)]
-        self.shop_items_changed.emit(self.shop_items)
+        with self._undoable():
+            self._write("shop", (location, item_name), MISSING)
         
     def clear_shop_items(self):
-        self.shop_items = []
-        self.shop_items_changed.emit(self.shop_items)
+        """User cleared the list (undoable, one step)."""
+        with self._undoable(), self.batch():
+            # Last entry first, so undo (which replays backwards) restores the order
+            for location, item_name in reversed(list(self._shop)):
+                self._write("shop", (location, item_name), MISSING)
+
+    @property
+    def shop_items(self):
+        """[{location, name}] in insertion order (fresh list)."""
+        return self._shop.to_list()
+
+    @property
+    def shop_store(self) -> ShopStore:
+        """Indexed shop entries; read-only by convention, mutate through register/unregister."""
+        return self._shop
 
     def update_hints(self, text):
         if self.hints_text != text:
              self.hints_text = text
-             self.hints_changed.emit(text)
+             self._emit("hints_changed", text)
+             self._autosave_record("hints", "", text)
 
     # [Removed toggle_auto_tracking, on_helper_data, process_auto_update]
 
     def reset_state(self):
         """Reset all tracker state to defaults (but keep options)."""
         logging.info("Resetting tracker state to defaults.")
-        self._inventory = {}
-        self._characters = {}
-        self._active_party = set()
-        self._obtained_capsules = set()
+        self._journal.clear()
+        with self.batch():
+            self._inventory = {}
+            self._invalidate_inventory()
+            self._characters = {}
+            self._active_party = set()
+            self._obtained_capsules = set()
         
-        self.reset_overrides()
+            self.reset_overrides()
         
-        # Unassign all map sprites explicitly
-        for loc, char in list(self._character_locations.items()):
-            self.character_unassigned.emit(loc, char)
-        self._character_locations = {}
+            # Unassign all map sprites explicitly
+            for loc, char in list(self._character_locations.items()):
+                self._emit("character_unassigned", loc, char)
+            self._rebuild_character_index({})
+            self._spoiler_placements = {}
         
-        # Locations reset
-        self._locations = {}
-        self.location_changed.emit("Reset", "reset") 
+            # Locations reset
+            self._locations = {}
+            self._invalidate_locations()
+            self._emit("location_changed", "Reset", "reset") 
         
-        # Emit all signals to clear UI
-        self.inventory_changed.emit({})
-        self.clear_shop_items()
+            # Emit all signals to clear UI
+            self._emit("inventory_changed", self.inventory)
+            self._shop = ShopStore()
+            self._emit("shop_items_changed", [])
         
-        self.hints_text = ""
-        # hints UI cleared by MainWindow._on_reset_occurred
+            self.hints_text = ""
+            # hints UI cleared by MainWindow._on_reset_occurred
+        
+            # Characters:
+            for name in ["Maxim", "Selan", "Guy", "Artea", "Tia", "Dekar", "Lexis", "Jelze", "Flash", "Gusto", "Zeppy", "Darbi", "Sully", "Blaze"]:
+                self._emit("character_changed", name, False)
         
-        # Characters:
-        for name in ["Maxim", "Selan", "Guy", "Artea", "Tia", "Dekar", "Lexis", "Jelze", "Flash", "Gusto", "Zeppy", "Darbi", "Sully", "Blaze"]:
-            self.character_changed.emit(name, False)
+            self._emit("player_position_changed", 0, 0)
         
-        self.player_position_changed.emit(0, 0)
+            self._emit("reset_occurred")
         
-        self.reset_occurred.emit()
+        self._autosave_snapshot()
 
 
 
@@ -291,65 +726,153 @@ class StateManager(QObject):
         Does NOT mark as obtained or cleared.
         """
         # Update internal map
-        self._character_locations[location] = character_name
+        self._link_character(location, character_name)
+        self._spoiler_placements[location] = character_name
+        self._autosave_record("character_location", location, character_name)
+        self._autosave_record("spoiler", location, character_name)
         # Emit signal so MapWidget can place the sprite (if location not cleared)
-        self.character_assigned.emit(location, character_name)
+        self._emit("character_assigned", location, character_name)
+
+    def solve_spoiler(self, goal: str = GOAL_LOCATION):
+        """
+        Runs the LogicEngine seed solver over the registered spoiler placements.
+        Returns a SeedSolution (spheres + items strictly required for the goal).
+        """
+        return self.logic_engine.solve_seed(self._spoiler_placements, goal=goal)
 
     # [Removed process_spoiler_log, update_capsule_sprites]
 
-    def save_state(self, filepath: str):
-        """Serialize current overrides AND progress to JSON."""
-        data = {
-            "inventory_overrides": self._manual_inventory_overrides,
-            "location_overrides": self._manual_location_overrides,
-            "character_locations": self._character_locations,
+    def state_snapshot(self) -> Dict[str, Any]:
+        """Save-file dict of the current overrides AND progress (copies, safe to hand to another thread)."""
+        return {
+            "inventory_overrides": dict(self._manual_inventory_overrides),
+            "location_overrides": dict(self._manual_location_overrides),
+            "character_locations": dict(self._character_locations),
             # Full State
-            "inventory": self._inventory,
-            "locations": self._locations,
-            "characters": self._characters,
+            "inventory": dict(self._inventory),
+            "locations": dict(self._locations),
+            "characters": dict(self._characters),
             "active_party": list(self._active_party),
             "obtained_capsules": list(self._obtained_capsules),
             "shop_items": self.shop_items,
-            "hints": self.hints_text
+            "hints": self.hints_text,
+            "spoiler_placements": dict(self._spoiler_placements),
         }
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+
+    def save_state(self, filepath: str):
+        """Serialize current overrides AND progress to JSON (temp file + rename)."""
+        write_state_file(filepath, self.state_snapshot())
         logging.info(f"State saved to {filepath}")
 
     def load_state(self, filepath: str):
         """Load state from JSON and apply."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        self._manual_inventory_overrides = data.get("inventory_overrides", {})
-        self._manual_location_overrides = data.get("location_overrides", {})
+        self.restore_state(read_state_file(filepath))
+        logging.info(f"State loaded from {filepath}")
+
+    def restore_state(self, data: Dict[str, Any]):
+        """Replaces the whole state with a state_snapshot() dict (one batch)."""
+        self._journal.clear()
+        with self.batch():
+            self._pending.replaced = True
+
+            self._manual_inventory_overrides = data.get("inventory_overrides", {})
+            self._manual_location_overrides = data.get("location_overrides", {})
         
-        # Restore State
-        self._inventory = data.get("inventory", {})
-        self._locations = data.get("locations", {})
-        self._characters = data.get("characters", {})
-        self._character_locations = data.get("character_locations", {})
+            # Restore State
+            self._inventory = data.get("inventory", {})
+            self._locations = data.get("locations", {})
+            self._invalidate_inventory()
+            self._invalidate_locations()
+            self._characters = data.get("characters", {})
+            self._rebuild_character_index(data.get("character_locations", {}))
+            self._spoiler_placements = dict(data.get("spoiler_placements", {}))
         
-        self.shop_items = data.get("shop_items", [])
-        self.shop_items_changed.emit(self.shop_items)
+            self._shop = ShopStore.from_list(data.get("shop_items", []))
+            self._emit("shop_items_changed", self.shop_items)
         
-        self.hints_text = data.get("hints", "")
-        self.hints_changed.emit(self.hints_text)
+            self.hints_text = data.get("hints", "")
+            self._emit("hints_changed", self.hints_text)
         
-        self._active_party = set(data.get("active_party", []))
-        self._obtained_capsules = set(data.get("obtained_capsules", []))
+            self._active_party = set(data.get("active_party", []))
+            self._obtained_capsules = set(data.get("obtained_capsules", []))
         
-        # Re-emit changes
-        self.inventory_changed.emit(self.inventory)
-        for loc, state in self._locations.items():
-            self.location_changed.emit(loc, state)
+            # Re-emit changes (effective states, so loaded overrides are painted too)
+            self._emit("inventory_changed", self.inventory)
+            for loc, state in self.locations.items():
+                self._emit("location_changed", loc, state)
         
-        # We need to re-emit character assignments essentially to place sprites
-        for loc, char in self._character_locations.items():
-             self.character_assigned.emit(loc, char)
+            # We need to re-emit character assignments essentially to place sprites
+            for loc, char in self._character_locations.items():
+                 self._emit("character_assigned", loc, char)
             
-        # Also emit character toggles
-        for char, obtained in self._characters.items():
-            self.character_changed.emit(char, obtained)
+            # Also emit character toggles
+            for char, obtained in self._characters.items():
+                self._emit("character_changed", char, obtained)
             
-        logging.info(f"State loaded from {filepath}")
+        self._autosave_snapshot()
+
+    # --- Autosave ---
+
+    def recover_autosave(self, autosave):
+        """
+        Restores the autosaved session (snapshot + journal tail) and starts
+        journaling every further change into `autosave` (an AutosaveJournal).
+        """
+        snapshot, records = autosave.recover()
+        if snapshot is not None or records:
+            with self.batch():
+                if snapshot is not None:
+                    self.restore_state(snapshot)
+                for record in records:
+                    self._replay_record(record)
+            self._journal.clear()
+            logging.info(f"Autosave: recovered session ({len(records)} journal records).")
+        
+        autosave.open()
+        if not autosave.enabled:
+            return # Not writable (logged), the tracker runs without autosave
+        self._autosave = autosave
+        self._autosave_snapshot() # Fold the replayed tail into a fresh snapshot
+
+    def _replay_record(self, record):
+        kind, key = record["kind"], record["key"]
+        value = MISSING if record.get("deleted") else record["value"]
+        if kind == "hints":
+            self.update_hints(value)
+        elif kind == "spoiler":
+            self._spoiler_placements[key] = value
+        elif kind == "shop":
+            self._apply_change(kind, tuple(key), value)
+        else:
+            self._apply_change(kind, key, value)
+
+    def _autosave_record(self, kind, key, value):
+        if self._autosave is None:
+            return
+        deleted = value is MISSING
+        # Only the append happens inline; compaction waits for sync_autosave
+        if self._autosave.append(kind, key, None if deleted else value, deleted):
+            self._autosave_compaction_due = True
+
+    def _autosave_snapshot(self):
+        """Rotates the journal and hands the snapshot write to the journal's executor."""
+        if self._autosave is not None:
+            self._autosave_compaction_due = False
+            self._autosave.write_snapshot(self.state_snapshot())
+
+    def sync_autosave(self):
+        """
+        fsyncs journal records written since the last call (batched durability)
+        and starts a due compaction. Called periodically, outside user actions.
+        """
+        if self._autosave is not None:
+            self._autosave.sync()
+            if self._autosave_compaction_due:
+                self._autosave_snapshot()
+
+    def close_autosave(self):
+        """Final snapshot on a clean exit (written inline: drain the executor first)."""
+        if self._autosave is not None:
+            self._autosave.write_snapshot(self.state_snapshot(), wait=True)
+            self._autosave.close()
+            self._autosave = None
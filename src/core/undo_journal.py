@@ -0,0 +1,80 @@
+"""
+Undo/redo journal for StateManager.
+
+A user action is stored as a group of primitive changes
+    (kind, key, before, after)
+that only describe the entries it touched; everything else is shared with
+the live state, so no dict is ever snapshotted. Both stacks are bounded
+deques: undo/redo move one group between them (O(1) in the history length)
+and memory stays flat however long the session runs.
+"""
+from collections import deque
+from typing import List, Optional, Tuple
+from utils.constants import UNDO_LIMIT
+
+# Marks "entry did not exist" in before/after values
+MISSING = object()
+
+Change = Tuple[str, object, object, object]
+
+
+class UndoJournal:
+    def __init__(self, limit: int = UNDO_LIMIT):
+        self._undo = deque(maxlen=limit)
+        self._redo = deque(maxlen=limit)
+        self._group: List[Change] = []
+        self._depth = 0
+        self._suspended = 0
+
+    # --- Recording ---
+
+    def begin(self):
+        """Opens an action; nested begin/end pairs join the outermost one."""
+        self._depth += 1
+
+    def end(self):
+        self._depth -= 1
+        if self._depth == 0 and self._group:
+            self._undo.append(tuple(self._group))
+            self._redo.clear()
+            self._group = []
+
+    def record(self, kind: str, key, before, after):
+        if self._depth and not self._suspended:
+            self._group.append((kind, key, before, after))
+
+    def suspend(self):
+        """Stops recording (while undo/redo replays changes)."""
+        self._suspended += 1
+
+    def resume(self):
+        self._suspended -= 1
+
+    # --- Undo / Redo ---
+
+    def pop_undo(self) -> Optional[Tuple[Change, ...]]:
+        """Returns the last action (changes in recorded order) and moves it to the redo stack."""
+        if not self._undo:
+            return None
+        group = self._undo.pop()
+        self._redo.append(group)
+        return group
+
+    def pop_redo(self) -> Optional[Tuple[Change, ...]]:
+        if not self._redo:
+            return None
+        group = self._redo.pop()
+        self._undo.append(group)
+        return group
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def clear(self):
+        """Drops all history (after reset/load the recorded entries no longer apply)."""
+        self._undo.clear()
+        self._redo.clear()
+        self._group = []
@@ -17,7 +17,7 @@ class ItemSearchDialog(QDialog):
         super().__init__(parent)
         self.location = location
         self.data_loader = data_loader
-        self.item_spells = data_loader.get_items_spells()
+        self.item_spells = data_loader.get_item_models() # {category: (Item, ...)}
         self.all_categories = list(self.item_spells.keys())
         self.current_category = self.all_categories[0] if self.all_categories else ""
         
@@ -38,7 +38,7 @@ class ItemSearchDialog(QDialog):
         
         self.loc_combo = QComboBox()
         # Populate with cities (requires access to DataLoader or just pass list)
-        cities = self.data_loader.get_cities()
+        cities = self.data_loader.get_city_models()
         self.loc_combo.addItems(sorted(cities))
         
         # Set current selection
@@ -101,25 +101,10 @@ class ItemSearchDialog(QDialog):
         self.list_widget.clear()
         query = self.search_bar.text().lower()
         
-        items = self.item_spells.get(self.current_category, {})
-        
-        # Flatten dict {id: name} to list of names
-        source_list = []
-        if isinstance(items, dict):
-            source_list = list(items.values())
-        elif isinstance(items, list):
-            source_list = items
-        
-        # Filter and sort
-        filtered_items = []
-        for item_name in source_list:
-            # Handle potential dicts if data structure changes
-            if isinstance(item_name, dict):
-                item_name = item_name.get('name', '')
-            
-            if query in str(item_name).lower():
-                filtered_items.append(str(item_name))
-                
+        items = self.item_spells.get(self.current_category, ())
+        
+        # Filter and sort (validated at load: names are non-empty strings)
+        filtered_items = [item.name for item in items if query in item.name.lower()]
         filtered_items.sort()
         
         for name in filtered_items:
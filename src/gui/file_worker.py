@@ -0,0 +1,56 @@
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+import logging
+
+
+class _FileTaskSignals(QObject):
+    # Created on the GUI thread, so connected slots run there (queued)
+    finished = pyqtSignal(object) # Return value of the task
+    failed = pyqtSignal(str)
+
+
+class FileTask(QRunnable):
+    """Runs a blocking file function on a worker thread and reports back via signals."""
+
+    def __init__(self, func, *args):
+        super().__init__()
+        self._func = func
+        self._args = args
+        self.signals = _FileTaskSignals()
+
+    def run(self):
+        try:
+            result = self._func(*self._args)
+        except Exception as e:
+            logging.error(f"File task failed: {e}")
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class FileWorker(QObject):
+    """
+    Single background thread for save/load.
+    One thread keeps the operations in the order they were requested.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._signals = set() # Keep signal objects alive until delivered
+
+    def submit(self, func, *args, on_finished=None, on_failed=None):
+        task = FileTask(func, *args)
+        signals = task.signals
+        self._signals.add(signals)
+        if on_finished:
+            signals.finished.connect(on_finished)
+        if on_failed:
+            signals.failed.connect(on_failed)
+        signals.finished.connect(lambda _: self._signals.discard(signals))
+        signals.failed.connect(lambda _: self._signals.discard(signals))
+        self._pool.start(task)
+
+    def wait(self, msecs=-1) -> bool:
+        """Blocks until queued tasks are done (used on exit)."""
+        return self._pool.waitForDone(msecs)
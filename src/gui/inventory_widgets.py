@@ -25,13 +25,7 @@ class ToolsWidget(QWidget):
     # ... connect_signals ...
     def connect_signals(self, state_manager):
         self.grid.item_clicked.connect(state_manager.toggle_manual_inventory)
-        state_manager.inventory_changed.connect(self._on_inventory_changed)
-
-    def _on_inventory_changed(self, inventory):
-        if hasattr(self.grid, 'icons'):
-            for name in self.grid.icons.keys():
-                is_obtained = inventory.get(name, False)
-                self.grid.set_item_state(name, is_obtained)
+        state_manager.state_delta.connect(self.grid.apply_delta)
             
     def set_content_font_size(self, size):
         self.grid.set_content_font_size(size)
@@ -68,13 +62,7 @@ class ScenarioWidget(QWidget):
 
     def connect_signals(self, state_manager):
         self.grid.item_clicked.connect(state_manager.toggle_manual_inventory)
-        state_manager.inventory_changed.connect(self._on_inventory_changed)
-
-    def _on_inventory_changed(self, inventory):
-        if hasattr(self.grid, 'icons'):
-            for name in self.grid.icons.keys():
-                is_obtained = inventory.get(name, False)
-                self.grid.set_item_state(name, is_obtained)
+        state_manager.state_delta.connect(self.grid.apply_delta)
 
     def set_content_font_size(self, size):
         self.grid.set_content_font_size(size)
@@ -10,11 +10,15 @@ from .map_widget import MapWidget
 from .dock_title_bar import DockTitleBar
 from .inventory_widgets import ToolsWidget, ScenarioWidget
 from .menu_ribbon import MenuRibbon
-from utils.constants import STATE_ORDER
+from utils.constants import AUTOSAVE_SYNC_INTERVAL_MS, DATA_RELOAD_POLL_MS
+from core.persistence import read_state_file, write_state_file
+from .file_worker import FileWorker
+from .map_sync import MapLogicSync
 from .widgets.items_widget import ItemsWidget
 from .widgets.characters_widget import CharactersWidget
 from .widgets.maiden_widget import MaidenWidget
 from .widgets.hint_widget import HintWidget
+from .widgets.next_item_widget import NextItemWidget
 from .dialogs.item_search_dialog import ItemSearchDialog
 from PyQt6.QtWidgets import QMenu
 
@@ -25,6 +29,7 @@ class MainWindow(QMainWindow):
         self.data_loader = data_loader
         self.logic_engine = logic_engine
         self.layout_manager = LayoutManager()
+        self._hovered_item = None # Item whose unlock preview is shown
         
         self.setWindowTitle("Lufia 2 Manual Tracker v1.4")
         self.resize(1024, 768)
@@ -38,6 +43,21 @@ class MainWindow(QMainWindow):
         self._connect_signals()
         
         self._active_search_dialogs = {}
+        
+        # Save/Load disk I/O runs off the GUI thread
+        self.file_worker = FileWorker(self)
+
+        # Autosave: journal records are fsynced in batches, not per click
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setInterval(AUTOSAVE_SYNC_INTERVAL_MS)
+        self._autosave_timer.timeout.connect(self.state_manager.sync_autosave)
+        self._autosave_timer.start()
+
+        # Hot reload: poll the data files, rebuild dependent caches, repaint changed dots
+        self._data_watch_timer = QTimer(self)
+        self._data_watch_timer.setInterval(DATA_RELOAD_POLL_MS)
+        self._data_watch_timer.timeout.connect(self._poll_data_files)
+        self._data_watch_timer.start()
 
         # Initial Refresh to apply Logic
         self._load_settings()
@@ -68,6 +88,8 @@ class MainWindow(QMainWindow):
         self.menu_ribbon.reset_requested.connect(self._handle_reset)
         self.menu_ribbon.save_requested.connect(self._handle_save)
         self.menu_ribbon.load_requested.connect(self._handle_load)
+        self.menu_ribbon.undo_requested.connect(self.state_manager.undo)
+        self.menu_ribbon.redo_requested.connect(self.state_manager.redo)
 
     def _toggle_font_controls(self, visible):
         # Iterate over all dock widgets
@@ -105,20 +127,30 @@ class MainWindow(QMainWindow):
         from PyQt6.QtWidgets import QFileDialog
         path, _ = QFileDialog.getSaveFileName(self, "Save Tracker State", "", "JSON Files (*.json)")
         if path:
-            try:
-                self.state_manager.save_state(path)
-            except Exception as e:
-                logging.error(f"Save Failed: {e}")
+            # Snapshot on the GUI thread (consistent copy), write in the background
+            self.file_worker.submit(
+                write_state_file, path, self.state_manager.state_snapshot(),
+                on_finished=lambda _: logging.info(f"State saved to {path}"),
+                on_failed=lambda e: logging.error(f"Save Failed: {e}")
+            )
 
     def _handle_load(self):
         from PyQt6.QtWidgets import QFileDialog
         path, _ = QFileDialog.getOpenFileName(self, "Load Tracker State", "", "JSON Files (*.json)")
         if path:
-            try:
-                self.state_manager.load_state(path)
-                self._refresh_all()
-            except Exception as e:
-                logging.error(f"Load Failed: {e}")
+            # Read/parse in the background, apply on the GUI thread in one batch
+            self.file_worker.submit(
+                read_state_file, path,
+                on_finished=lambda data: self._apply_loaded_state(path, data),
+                on_failed=lambda e: logging.error(f"Load Failed: {e}")
+            )
+
+    def _apply_loaded_state(self, path, data):
+        try:
+            self.state_manager.restore_state(data)
+            logging.info(f"State loaded from {path}")
+        except Exception as e:
+            logging.error(f"Load Failed: {e}")
 
     def _on_player_shape_requested(self, shape):
         if shape == "sprite":
@@ -162,9 +194,9 @@ class MainWindow(QMainWindow):
     def _update_player_sprite_if_active(self):
         leader = self.state_manager.get_active_party_leader()
         if leader:
-             chars_data = self.data_loader.load_json("characters.json")
-             if leader in chars_data:
-                  path = self.data_loader.resolve_image_path(chars_data[leader]["image_path"])
+             characters = self.data_loader.get_character_models()
+             if leader in characters:
+                  path = self.data_loader.resolve_image_path(characters[leader].image_path)
                   self.map_widget.set_player_sprite_image(path)
 
     def _setup_docking_ui(self):
@@ -189,6 +221,15 @@ class MainWindow(QMainWindow):
         self.hints_dock.setMaximumWidth(350) # Prevent taking too much horizontal space
         self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.hints_dock)
         
+        # --- Next Items Dock (Left, below Hints) ---
+        self.next_items_dock = PersistentDockWidget("Next Items", self)
+        self.next_items_dock.setObjectName("next_items_dock")
+        self.next_item_widget = NextItemWidget(self.data_loader, self.state_manager, self.logic_engine)
+        self.next_items_dock.setWidget(self.next_item_widget)
+        self.next_items_dock.setMinimumSize(100, 100)
+        self.next_items_dock.setMaximumWidth(350)
+        self.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, self.next_items_dock)
+        
         # --- Characters Dock (Top Right for T-Shape) ---
         self.chars_dock = PersistentDockWidget("Characters", self)
         self.chars_dock.setObjectName("chars_dock")
@@ -233,6 +274,7 @@ class MainWindow(QMainWindow):
         
         # 1. Left Area: Items / Hints
         self.splitDockWidget(self.items_dock, self.hints_dock, Qt.Orientation.Vertical)
+        self.splitDockWidget(self.hints_dock, self.next_items_dock, Qt.Orientation.Vertical)
         
         # 2. Right Area T-Shape:
         # Chars occupies the Top sector.
@@ -266,7 +308,7 @@ class MainWindow(QMainWindow):
         
         # --- Fluidity Policies ---
         from PyQt6.QtWidgets import QSizePolicy
-        for dock in [self.items_dock, self.hints_dock, self.chars_dock, self.tools_dock, 
+        for dock in [self.items_dock, self.hints_dock, self.next_items_dock, self.chars_dock, self.tools_dock, 
                      self.maidens_dock, self.scenario_dock, self.map_dock]:
              policy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
              policy.setVerticalStretch(1)
@@ -281,26 +323,31 @@ class MainWindow(QMainWindow):
 
     def _connect_signals(self):
         # State Manager Signals -> UI Updates
-        self.state_manager.location_changed.connect(self.map_widget.update_dot_color)
         self.state_manager.player_position_changed.connect(self.map_widget.update_player_position)
         # Inventory Widgets connect themselves
         self.tools_widget.connect_signals(self.state_manager)
         self.scenario_widget.connect_signals(self.state_manager)
         
+        # Hover "what-if" preview of an item's unlocks
+        self.tools_widget.grid.item_hovered.connect(self._on_item_hovered)
+        self.scenario_widget.grid.item_hovered.connect(self._on_item_hovered)
+        
         # Connect Items Widget Add Button
         self.items_widget.add_requested.connect(lambda: self._open_item_search())
         
-        # Logic Loop Trigger (Inventory Change -> Refresh All)
-        self.state_manager.inventory_changed.connect(lambda _: self._refresh_all())
+        # Logic Loop (State Delta -> dot colors/tooltips, dot clicks -> manual states)
+        self.map_sync = MapLogicSync(self.map_widget, self.state_manager, self.logic_engine, self.data_loader, self)
+        self.map_sync.refreshed.connect(self.next_item_widget.refresh)
+        # Keep a shown unlock preview in step with the dots it rings
+        self.map_sync.refreshed.connect(self._refresh_unlock_preview)
+        self.state_manager.state_delta.connect(self._refresh_unlock_preview)
         
         # UI Signals -> State Manager Overrides
-        self.map_widget.location_clicked.connect(self._handle_location_click)
         self.map_widget.location_right_clicked.connect(self._handle_location_right_click)
 
         # Character Signals
         self.state_manager.character_assigned.connect(self._on_character_assigned)
         self.state_manager.character_unassigned.connect(self.map_widget.remove_character_sprite)
-        self.state_manager.character_changed.connect(lambda n, o: self.characters_widget.refresh_state())
         
         # Map Sprite Removal Interactivity
         self.map_widget.sprite_removed.connect(self.state_manager.remove_character_assignment)
@@ -310,7 +357,6 @@ class MainWindow(QMainWindow):
         
         # New Signals (v1.4 Refinements)
         self.menu_ribbon.sprite_visibility_toggled.connect(self.map_widget.set_sprites_visibility)
-        self.state_manager.shop_items_changed.connect(lambda _: self.items_widget.refresh_from_state())
         
         # Hints
         if self.hint_widget:
@@ -327,72 +373,38 @@ class MainWindow(QMainWindow):
         if self.map_widget:
             self.map_widget.reset()
             
-        # Clear Items/Spells
-        if self.items_widget:
-            self.items_widget.clear_all()
-            
         # Refresh Logic (Just in case)
         self._refresh_all()
         
-    def _refresh_all(self):
-        """Re-runs logic engine and pushes updates."""
-        # Get Accessibility Map
-        accessibility = self.logic_engine.calculate_accessibility(self.state_manager.inventory)
-        
-        # Current Location States (Overrides + Cleared)
-        current_loc_states = self.state_manager.locations
-        
-        # Update every dot on the map
-        locations_data = self.data_loader.get_locations() # {name: coords}
-        for name in locations_data.keys():
-            is_accessible = accessibility.get(name, False)
-            
-            # Check if this location is "cleared" in the state
-            is_cleared = (current_loc_states.get(name) == "cleared")
-            
-            # Determine color
-            final_color = self.logic_engine.determine_color(name, is_accessible, is_cleared)
-            
-            # Use StateManager's effective state if present
-            effective_state = current_loc_states.get(name)
-            if effective_state:
-                final_color = effective_state
-            
-            # Tooltip Info
-            tooltip_text = name
-            if not is_accessible and final_color == "not_accessible":
-                # Get missing info
-                reqs = self.logic_engine.get_missing_requirements(name, self.state_manager.inventory)
-                if reqs:
-                    req_str = " OR ".join(reqs)
-                    tooltip_text += f"\nRequires: {req_str}"
-            
-            self.map_widget.update_dot_color(name, final_color)
-            self.map_widget.update_dot_tooltip(name, tooltip_text)
-
-    def _handle_location_click(self, name):
-        """User clicked a dot: Cycle the state (Manual Override)."""
-        current_state = self.state_manager.locations.get(name)
-        
-        cycle_order = list(STATE_ORDER)
-        if name in self.data_loader.get_cities():
-             cycle_order = ["city"]
-        else:
-             cycle_order = ["not_accessible", "fully_accessible", "cleared"]
+    def _poll_data_files(self):
+        changed = self.data_loader.reload_changed()
+        if changed:
+            self.state_manager.reload_data(changed)
 
-        if not current_state or current_state not in cycle_order:
-             new_state = cycle_order[0]
+    def _refresh_all(self):
+        """Re-runs logic engine and pushes updates (map dots + Next Items)."""
+        self.map_sync.refresh_all()
+
+    def _on_item_hovered(self, name, entered):
+        """Previews which red dots the hovered item would open (state untouched)."""
+        if entered:
+            self._hovered_item = name
+        elif name == self._hovered_item:
+            self._hovered_item = None
+        self._refresh_unlock_preview()
+
+    def _refresh_unlock_preview(self, *_):
+        """Recomputes the preview against the current logic (cleared when nothing is hovered)."""
+        if self._hovered_item is None:
+            self.map_widget.clear_unlock_preview()
         else:
-             idx = cycle_order.index(current_state)
-             new_state = cycle_order[(idx + 1) % len(cycle_order)]
-                
-        self.state_manager.set_manual_location_state(name, new_state)
+            self.map_widget.show_unlock_preview(self.logic_engine.unlocks_for(self._hovered_item))
 
     def _handle_location_right_click(self, name):
         """Show Context Menu."""
         logging.info(f"Right clicked {name}")
         
-        cities = self.data_loader.get_cities()
+        cities = self.data_loader.get_city_models()
         if name in cities:
             pass # Item Search logic was moved to ItemsWidget in v1.4.3
         else:
@@ -403,8 +415,7 @@ class MainWindow(QMainWindow):
         menu.setTitle(f"Assign to {location_name}")
         
         # Get all chars
-        chars_data = self.data_loader.load_json("characters.json")
-        sorted_names = sorted(chars_data.keys())
+        sorted_names = sorted(self.data_loader.get_character_models())
         
         # Filter: Exclude characters currently in active party
         # StateManager knows "active_party" (The 4 humans).
@@ -413,9 +424,6 @@ class MainWindow(QMainWindow):
         # Also exclude characters that are already obtained/assigned?
         # obtained_map = self.state_manager.obtained_characters 
         
-        # Get assigned chars
-        assigned_chars = set(self.state_manager._character_locations.values())
-
         for char in sorted_names:
             if char in ["Claire", "Lisa", "Marie"]: continue
             
@@ -423,7 +431,7 @@ class MainWindow(QMainWindow):
             # (Matches v1.3 "User can assign them map locations")
                 
             # If already assigned to ANY location, skip (must remove first to re-assign)
-            if char in assigned_chars:
+            if self.state_manager.is_character_assigned(char):
                 continue
                 
             action = menu.addAction(char)
@@ -444,15 +452,14 @@ class MainWindow(QMainWindow):
 
     def _on_character_assigned(self, location, name):
         # Resolve path
-        chars_data = self.data_loader.load_json("characters.json")
+        character = self.data_loader.get_character_models().get(name)
         
         # Fix for crash if name not in json (e.g. Shaggy)
-        if name not in chars_data:
+        if character is None:
             logging.warning(f"Character '{name}' not found in characters.json. Skipping map sprite.")
             return
 
-        rel_path = chars_data[name]["image_path"]
-        full_path = self.data_loader.resolve_image_path(rel_path)
+        full_path = self.data_loader.resolve_image_path(character.image_path)
         
         self.map_widget.add_character_sprite(location, name, full_path)
 
@@ -461,7 +468,7 @@ class MainWindow(QMainWindow):
         if not location_name:
             cities = getattr(self, '_cities_cache', None)
             if not cities:
-                 cities = self.data_loader.get_cities()
+                 cities = self.data_loader.get_city_models()
                  self._cities_cache = cities
             
             # Sort for deterministic first element or use first
@@ -509,6 +516,13 @@ class MainWindow(QMainWindow):
         except Exception as e:
              logging.error(f"Failed to save settings: {e}")
         
+        # Let a pending save finish, then fold the autosave journal into its snapshot
+        self.file_worker.wait()
+        try:
+            self.state_manager.close_autosave()
+        except OSError as e:
+            logging.error(f"Autosave failed: {e}")
+        
         super().closeEvent(event)
 
     def _load_settings(self):
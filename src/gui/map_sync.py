@@ -0,0 +1,141 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+from utils.constants import STATE_ORDER
+
+
+class MapLogicSync(QObject):
+    """
+    Keeps one MapWidget's dot colors and tooltips in sync with one
+    StateManager through its LogicEngine, and turns dot clicks into manual
+    location states. MainWindow and every multi-session view use one each.
+    """
+    refreshed = pyqtSignal() # After a logic-driven repaint (item change / full refresh)
+
+    def __init__(self, map_widget, state_manager, logic_engine, data_loader, parent=None):
+        super().__init__(parent)
+        self.map_widget = map_widget
+        self.state_manager = state_manager
+        self.logic_engine = logic_engine
+        self.data_loader = data_loader
+
+        state_manager.state_delta.connect(self._on_state_delta)
+        state_manager.changes_committed.connect(self._on_changes_committed)
+        state_manager.data_reloaded.connect(self._on_data_reloaded)
+        map_widget.location_clicked.connect(self.handle_location_click)
+
+    def refresh_all(self):
+        """Re-runs logic engine and pushes updates."""
+        # Get Accessibility Map (also the baseline for incremental updates)
+        accessibility = self.logic_engine.track_inventory(self.state_manager.inventory)
+
+        # Update every dot on the map
+        locations_data = self.data_loader.get_location_models() # {name: Location}
+        self.refresh_locations(locations_data.keys(), accessibility)
+        self.refreshed.emit()
+
+    def _on_state_delta(self, delta):
+        """Re-evaluates only the locations whose rules mention a toggled item."""
+        if delta.replaced:
+            # Wholesale swap: only track the inventory, changes_committed repaints once
+            for item in delta.items_added:
+                self.logic_engine.apply_delta(item, True)
+            for item in delta.items_removed:
+                self.logic_engine.apply_delta(item, False)
+            return
+
+        # Manual states first, then the logic re-evaluation
+        self.map_widget.apply_delta(delta)
+        # Dots that lost their manual state (undo) go back to their logic color
+        restored = [name for name, state in delta.locations.items() if not state]
+        if restored:
+            self.refresh_locations(restored, self.logic_engine.tracked_accessibility)
+
+        if not (delta.items_added or delta.items_removed):
+            return
+
+        # Dots whose rules mention a changed item (color and/or tooltip may change)
+        affected = set()
+        for item in delta.items_added:
+            affected.update(self.logic_engine.dependent_locations(item))
+            self.logic_engine.apply_delta(item, True)
+        for item in delta.items_removed:
+            affected.update(self.logic_engine.dependent_locations(item))
+            self.logic_engine.apply_delta(item, False)
+
+        if affected:
+            locations_data = self.data_loader.get_location_models()
+            self.refresh_locations(
+                [name for name in affected if name in locations_data],
+                self.logic_engine.tracked_accessibility
+            )
+        self.refreshed.emit()
+
+    def _on_changes_committed(self, changes):
+        """After a wholesale state swap (load) repaint every dot once."""
+        if changes.replaced:
+            # The state delta already updated the tracked accessibility
+            self.refresh_locations(
+                self.data_loader.get_location_models().keys(),
+                self.logic_engine.tracked_accessibility
+            )
+            self.refreshed.emit()
+
+    def _on_data_reloaded(self, reload):
+        """Static data hot reload: repaint only the dots whose logic changed."""
+        locations_data = self.data_loader.get_location_models()
+        if reload.files & {"locations.json", "cities.json"}:
+            self.map_widget.sync_locations(locations_data, self.data_loader.get_city_models())
+            names = locations_data.keys()
+        else:
+            names = [name for name in reload.locations if name in locations_data]
+        self.refresh_locations(names, self.logic_engine.tracked_accessibility)
+        self.refreshed.emit()
+
+    def refresh_locations(self, names, accessibility):
+        """Pushes color and tooltip for the given dots."""
+        # Current Location States (Overrides + Cleared)
+        current_loc_states = self.state_manager.locations
+        inventory = self.state_manager.inventory
+
+        for name in names:
+            is_accessible = accessibility.get(name, False)
+
+            # Check if this location is "cleared" in the state
+            is_cleared = (current_loc_states.get(name) == "cleared")
+
+            # Determine color
+            final_color = self.logic_engine.determine_color(name, is_accessible, is_cleared)
+
+            # Use StateManager's effective state if present
+            effective_state = current_loc_states.get(name)
+            if effective_state:
+                final_color = effective_state
+
+            # Tooltip Info
+            tooltip_text = name
+            if not is_accessible and final_color == "not_accessible":
+                # Get missing info
+                reqs = self.logic_engine.get_missing_requirements(name, inventory)
+                if reqs:
+                    req_str = " OR ".join(reqs)
+                    tooltip_text += f"\nRequires: {req_str}"
+
+            self.map_widget.update_dot_color(name, final_color)
+            self.map_widget.update_dot_tooltip(name, tooltip_text)
+
+    def handle_location_click(self, name):
+        """User clicked a dot: Cycle the state (Manual Override)."""
+        current_state = self.state_manager.locations.get(name)
+
+        cycle_order = list(STATE_ORDER)
+        if name in self.data_loader.get_city_models():
+             cycle_order = ["city"]
+        else:
+             cycle_order = ["not_accessible", "fully_accessible", "cleared"]
+
+        if not current_state or current_state not in cycle_order:
+             new_state = cycle_order[0]
+        else:
+             idx = cycle_order.index(current_state)
+             new_state = cycle_order[(idx + 1) % len(cycle_order)]
+
+        self.state_manager.set_manual_location_state(name, new_state)
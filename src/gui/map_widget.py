@@ -4,6 +4,20 @@ from PyQt6.QtGui import QPixmap, QBrush, QColor, QPainter, QPolygonF, QPen
 import logging
 from utils.constants import GAME_WORLD_SIZE, CANVAS_SIZE, COLORS
 
+# (path, size) -> QPixmap. QPixmap data is implicitly shared, so every map
+# view (e.g. one per session) reuses the same decoded image.
+_pixmap_cache = {}
+
+def _cached_pixmap(path, size=None):
+    key = (path, size)
+    pix = _pixmap_cache.get(key)
+    if pix is None:
+        pix = QPixmap(path)
+        if size is not None:
+            pix = pix.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        _pixmap_cache[key] = pix
+    return pix
+
 class InteractiveDot(QGraphicsItem):
     """
     A clickable dot on the map representing a location/city.
@@ -167,7 +181,7 @@ class MapWidget(QGraphicsView):
         
         # Load Map
         map_path = data_loader.resolve_image_path("map/map.jpg")
-        self._background_item = QGraphicsPixmapItem(QPixmap(map_path))
+        self._background_item = QGraphicsPixmapItem(_cached_pixmap(map_path))
         
         orig_width = self._background_item.pixmap().width()
         orig_height = self._background_item.pixmap().height()
@@ -179,8 +193,9 @@ class MapWidget(QGraphicsView):
         
         self._dots = {}
         self._player_arrow = None
+        self._preview_rings = {} # name -> ring item (what-if overlay, created on demand)
         
-        self._init_locations(data_loader.get_locations())
+        self._init_locations(data_loader.get_location_models(), data_loader.get_city_models())
         self._init_player_arrow()
         
         # User requested restoration of static marker behavior (no blinking).
@@ -202,35 +217,52 @@ class MapWidget(QGraphicsView):
 
     # ... (init methods) ...
 
-    def _init_locations(self, locations_data):
-        """Creates a dot for every location in the JSON."""
-        import json
-        cities = []
-        try:
-            with open(r"d:\Projects\Python\lufia2_manualtracker_v1.4\src\data\cities.json", "r") as f:
-                cities = json.load(f)
-        except:
-            pass
-
-        for name, coords in locations_data.items():
+    def _init_locations(self, locations, cities):
+        """Creates a dot for every location ({name: core.models.Location})."""
+        for name, location in locations.items():
             # Apply scaling 4096 -> 400
-            canvas_x = coords[0] * self._scale_x
-            canvas_y = coords[1] * self._scale_y
+            canvas_x = location.x * self._scale_x
+            canvas_y = location.y * self._scale_y
             
             dot = InteractiveDot(name, canvas_x, canvas_y)
             
             if getattr(self, '_city_color_hex', None):
                  dot.set_custom_color(self._city_color_hex)
             
-            if name in cities:
-                dot._is_city = True
-                dot.set_shape(getattr(self, '_city_shape', 'square'), is_city=True)
-            else:
-                dot.set_shape(getattr(self, '_dungeon_shape', 'circle'), is_city=False)
+            self._apply_dot_kind(dot, name in cities)
                 
             self._scene.addItem(dot)
             self._dots[name] = dot
 
+    def _apply_dot_kind(self, dot, is_city):
+        if is_city:
+            dot.set_shape(getattr(self, '_city_shape', 'square'), is_city=True)
+        else:
+            dot.set_shape(getattr(self, '_dungeon_shape', 'circle'), is_city=False)
+
+    def sync_locations(self, locations, cities):
+        """
+        Hot reload: adds, removes and moves dots to match new location data.
+        Colors/tooltips of the result are pushed by the caller (MapLogicSync).
+        """
+        # Preview rings are recreated on demand at the new positions
+        for ring in self._preview_rings.values():
+            self._scene.removeItem(ring)
+        self._preview_rings.clear()
+
+        for name in [name for name in self._dots if name not in locations]:
+            self._scene.removeItem(self._dots.pop(name))
+
+        new_locations = {}
+        for name, location in locations.items():
+            dot = self._dots.get(name)
+            if dot is None:
+                new_locations[name] = location
+                continue
+            dot.setPos(location.x * self._scale_x, location.y * self._scale_y)
+            self._apply_dot_kind(dot, name in cities)
+        self._init_locations(new_locations, cities)
+
     def _init_player_arrow(self):
         """Creates the player position marker."""
         self.set_player_arrow_shape("triangle")
@@ -320,6 +352,12 @@ class MapWidget(QGraphicsView):
         if name in self._dots:
             self._dots[name].set_color(color_name)
 
+    def apply_delta(self, delta):
+        """Recolors only the dots named in a StateManager delta."""
+        for name, state in delta.locations.items():
+            if state: # "" = override removed, MainWindow repaints it from logic
+                self.update_dot_color(name, state)
+
     def update_dot_tooltip(self, name, text):
         if name in self._dots:
             self._dots[name].setToolTip(text)
@@ -467,11 +505,8 @@ class MapWidget(QGraphicsView):
         # Remove existing if any
         self.remove_character_sprite(location)
  
-        # Create Pixmap Item
-        pix = QPixmap(pixmap_path)
-        # Scale to 32x32
-        pixel_size = 32
-        pix = pix.scaled(pixel_size, pixel_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        # Create Pixmap Item (scaled to 32x32, shared between map views)
+        pix = _cached_pixmap(pixmap_path, 32)
         
         # Use InteractiveSprite with Remove Callback
         item = InteractiveSprite(pix, remove_callback=lambda: self.sprite_removed.emit(location))
@@ -537,3 +572,33 @@ class MapWidget(QGraphicsView):
             self._highlighted_dot._is_highlighted = False
             self._highlighted_dot.update()
             self._highlighted_dot = None
+
+    def show_unlock_preview(self, names):
+        """
+        Overlay: rings the given dots to preview what an item would open.
+        Only dots that are currently red get a ring; dot colors stay untouched.
+        """
+        self.clear_unlock_preview()
+        for name in names:
+            dot = self._dots.get(name)
+            if dot is None or dot._color_name != "not_accessible":
+                continue
+            
+            ring = self._preview_rings.get(name)
+            if ring is None:
+                r = dot._size / 2.0 + 4
+                ring = QGraphicsEllipseItem(-r, -r, r * 2, r * 2)
+                pen = QPen(QColor(COLORS['accessible']))
+                pen.setWidthF(2.0)
+                ring.setPen(pen)
+                ring.setBrush(QBrush(Qt.BrushStyle.NoBrush))
+                ring.setPos(dot.pos())
+                ring.setZValue(50) # Above dots, below player marker
+                ring.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+                self._scene.addItem(ring)
+                self._preview_rings[name] = ring
+            ring.show()
+
+    def clear_unlock_preview(self):
+        for ring in self._preview_rings.values():
+            ring.hide()
@@ -1,5 +1,5 @@
 from PyQt6.QtWidgets import QMenuBar, QMenu, QWidget, QHBoxLayout
-from PyQt6.QtGui import QAction
+from PyQt6.QtGui import QAction, QKeySequence
 from PyQt6.QtCore import pyqtSignal
 from .help_dialogs import HelpDialog, AboutDialog
 
@@ -12,6 +12,8 @@ class MenuRibbon(QWidget):
     reset_requested = pyqtSignal()
     save_requested = pyqtSignal()
     load_requested = pyqtSignal()
+    undo_requested = pyqtSignal()
+    redo_requested = pyqtSignal()
     
     # Customization Signals
     player_color_requested = pyqtSignal()
@@ -72,6 +74,20 @@ class MenuRibbon(QWidget):
         options_menu.addAction("Reset", self.reset_requested.emit)
         options_menu.addAction("Save", self.save_requested.emit)
         options_menu.addAction("Load", self.load_requested.emit)
+        options_menu.addSeparator()
+        
+        # Undo/Redo (Ctrl+Z / Ctrl+Y, shortcuts work while the window is focused)
+        undo_action = QAction("Undo", self)
+        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
+        undo_action.triggered.connect(self.undo_requested)
+        options_menu.addAction(undo_action)
+        self.addAction(undo_action)
+        
+        redo_action = QAction("Redo", self)
+        redo_action.setShortcuts([QKeySequence("Ctrl+Y"), QKeySequence.StandardKey.Redo])
+        redo_action.triggered.connect(self.redo_requested)
+        options_menu.addAction(redo_action)
+        self.addAction(redo_action)
         
         # --- Custom (Middle) ---
         custom_menu = self.menu_bar.addMenu("Custom")
@@ -0,0 +1,40 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+from core.events import Signal
+
+
+class QtStateManager(QObject):
+    """
+    Qt face of the (Qt-free) core StateManager.
+    Re-exposes its signals as pyqtSignals and forwards every other attribute,
+    so widgets keep using `state_manager.<signal>.connect(...)` with Qt
+    semantics (slots may take fewer arguments, QObject receivers auto-disconnect).
+    """
+
+    inventory_changed = pyqtSignal(object)
+    location_changed = pyqtSignal(str, str)
+    player_position_changed = pyqtSignal(float, float)
+    character_changed = pyqtSignal(str, bool)
+    character_assigned = pyqtSignal(str, str)
+    character_unassigned = pyqtSignal(str, str)
+
+    reset_occurred = pyqtSignal()
+
+    shop_items_changed = pyqtSignal(list)
+    shop_item_added = pyqtSignal(str, str)
+    shop_item_removed = pyqtSignal(str, str)
+    hints_changed = pyqtSignal(str)
+
+    changes_committed = pyqtSignal(object)
+    state_delta = pyqtSignal(object)
+    data_reloaded = pyqtSignal(object)
+
+    def __init__(self, core, parent=None):
+        super().__init__(parent)
+        self.core = core
+        for name, attr in vars(type(core)).items():
+            if isinstance(attr, Signal):
+                getattr(core, name).connect(getattr(self, name).emit)
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the adapter itself
+        return getattr(self.core, name)
@@ -0,0 +1,84 @@
+from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel
+from PyQt6.QtCore import Qt, QTimer
+from core.layout_manager import LayoutManager
+from .map_widget import MapWidget
+from .map_sync import MapLogicSync
+from .inventory_widgets import ToolsWidget, ScenarioWidget
+from .qt_state import QtStateManager
+from utils.constants import DATA_RELOAD_POLL_MS
+
+
+class SessionPanel(QWidget):
+    """One session column: name, tools, keys and its own map view."""
+
+    def __init__(self, name, state_manager, data_loader, layout_manager, parent=None):
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.data_loader = data_loader
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+
+        title = QLabel(name)
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title.setStyleSheet("font-weight: bold; font-size: 14px;")
+        layout.addWidget(title)
+
+        self.tools_widget = ToolsWidget(data_loader, layout_manager)
+        self.scenario_widget = ScenarioWidget(data_loader, layout_manager)
+        self.map_widget = MapWidget(data_loader)
+        self.map_widget.setMinimumSize(200, 200)
+        layout.addWidget(self.tools_widget, 1)
+        layout.addWidget(self.scenario_widget, 2)
+        layout.addWidget(self.map_widget, 4)
+
+        self.tools_widget.connect_signals(state_manager)
+        self.scenario_widget.connect_signals(state_manager)
+        self.map_sync = MapLogicSync(self.map_widget, state_manager, state_manager.logic_engine, data_loader, self)
+
+        state_manager.player_position_changed.connect(self.map_widget.update_player_position)
+        state_manager.character_assigned.connect(self._on_character_assigned)
+        state_manager.character_unassigned.connect(self.map_widget.remove_character_sprite)
+        self.map_widget.sprite_removed.connect(state_manager.remove_character_assignment)
+
+        self.map_sync.refresh_all()
+
+    def _on_character_assigned(self, location, name):
+        character = self.data_loader.get_character_models().get(name)
+        if character is None:
+            return
+        full_path = self.data_loader.resolve_image_path(character.image_path)
+        self.map_widget.add_character_sprite(location, name, full_path)
+
+
+class SessionWindow(QMainWindow):
+    """
+    Side-by-side views of every session of a core.session_host.SessionHost
+    (e.g. one column per racer on a restream).
+    """
+
+    def __init__(self, session_host):
+        super().__init__()
+        self.setWindowTitle(f"Lufia 2 Tracker - {len(session_host)} Sessions")
+        self.session_host = session_host
+        # Layout config is read-only here, one manager serves every panel
+        self.layout_manager = LayoutManager()
+
+        central = QWidget()
+        row = QHBoxLayout(central)
+        row.setContentsMargins(0, 0, 0, 0)
+        self.setCentralWidget(central)
+
+        self.panels = {}
+        for name, state_manager in session_host.sessions.items():
+            panel = SessionPanel(name, QtStateManager(state_manager), session_host.data_loader, self.layout_manager)
+            row.addWidget(panel)
+            self.panels[name] = panel
+
+        self.resize(320 * max(1, len(self.panels)), 800)
+
+        # Hot reload of the shared data (compiled once, then adopted by each session)
+        self._data_watch_timer = QTimer(self)
+        self._data_watch_timer.setInterval(DATA_RELOAD_POLL_MS)
+        self._data_watch_timer.timeout.connect(session_host.reload_changed)
+        self._data_watch_timer.start()
@@ -140,7 +140,7 @@ class CharactersCanvas(QWidget):
         # No Layout - Absolute Positioning
         
         # Load Characters
-        chars_data = self.data_loader.load_json("characters.json")
+        chars_data = self.data_loader.get_character_models()
         
         excluded = ["Claire", "Lisa", "Marie"]
         heroes = ["Maxim", "Selan", "Guy", "Artea", "Tia", "Dekar", "Lexis"]
@@ -243,15 +243,12 @@ class CharactersCanvas(QWidget):
         self.setMinimumSize(max_x + 10, max_y + 10)
             
     def connect_signals(self):
-        self.state_manager.character_changed.connect(self._on_character_changed)
-        self.state_manager.character_assigned.connect(self._on_assignment_changed)
-        self.state_manager.character_unassigned.connect(self._on_assignment_changed)
+        self.state_manager.changes_committed.connect(self._on_changes_committed)
 
-    def _on_character_changed(self, name, obtained):
-        self.refresh_state()
-
-    def _on_assignment_changed(self, location, name):
-        self.refresh_state()
+    def _on_changes_committed(self, changes):
+        # One rebuild per commit, however many characters a load touched
+        if changes.characters or changes.assignments or changes.reset:
+            self.refresh_state()
         
     def set_content_font_size(self, size):
         for cell in self.cells.values():
@@ -276,61 +273,32 @@ class CharactersCanvas(QWidget):
         # Calculate next state
         next_state = (current_state + 1) % 3
         
-        if next_state == 0:
-            # Set to Not Obtained (and Not Active)
-            self.state_manager.set_character_obtained(name, False)
-            if name in self.state_manager._active_party:
-                self.state_manager._active_party.remove(name)
-                
-        elif next_state == 1:
-             # Set to Obtained (but Not Active)
-             self.state_manager.set_character_obtained(name, True)
-             if name in self.state_manager._active_party:
-                self.state_manager._active_party.remove(name)
-                
-        elif next_state == 2:
-             # Set to Obtained AND Active
-             self.state_manager.set_character_obtained(name, True)
-             self.state_manager._active_party.add(name)
-        
-        # Note: Active Party List is mainly for order, which we don't strictly track manually here easily
-        # unless we append. For now, set updates are enough for widget refresh.
-        # MainWindow usually refreshes logic. CharactersWidget listens to signals.
-        
-        # Manually trigger signal because accessing _active_party directly doesn't emit.
-        # AND set_character_obtained emits only if obtained status changes.
-        # If moving from 1 -> 2, obtained is True -> True (no emit).
-        # So we force emit 'character_changed' to refresh UI.
-        self.state_manager.character_changed.emit(name, next_state != 0)
+        # 0: Not Obtained (and Not Active), 1: Obtained (but Not Active), 2: Obtained AND Active
+        # StateManager emits character_changed for both parts, which refreshes this widget.
+        self.state_manager.set_character_status(name, obtained=next_state != 0, active=next_state == 2)
         
     def refresh_state(self):
         active_party = self.state_manager.active_party # Humans Only
         obtained_capsules = getattr(self.state_manager, '_obtained_capsules', set())
         obtained_chars = self.state_manager.obtained_characters
         
-        # Get reverse lookup for locations: Character -> Location
-        char_locations = {} 
-        for loc, char in self.state_manager._character_locations.items():
-            char_locations[char] = loc
-            
-        chars_data = self.data_loader.load_json("characters.json")
+        characters = self.data_loader.get_character_models()
         
         for name, cell in self.cells.items():
-            if name not in chars_data:
+            if name not in characters:
                 continue
                 
             is_active_human = name in active_party
             is_active_capsule = name in obtained_capsules
             is_obtained = obtained_chars.get(name, False)
-            location = char_locations.get(name)
+            location = self.state_manager.get_location_of_character(name)
             
             # --- Visual Logic ---
             # 1. Active Human or Capsule -> Full Opacity
             # 2. Recruited Inactive Human -> Dimmed (0.5) 
             # 3. Not Obtained -> Dimmed / Grey (0.3)
             
-            rel_path = chars_data[name]["image_path"]
-            full_path = self.data_loader.resolve_image_path(rel_path)
+            full_path = self.data_loader.resolve_image_path(characters[name].image_path)
             pix = QPixmap(full_path)
             
             # Reset Styling
@@ -395,11 +363,6 @@ class CharactersWidget(QWidget):
         
         self.layout.addWidget(self.scroll_area)
         
-        # Connect signals
-        self.state_manager.character_changed.connect(self.refresh_state)
-        # Also need assignment changes
-        self.state_manager.character_assigned.connect(lambda l, n: self.refresh_state())
-        
     def set_content_font_size(self, size):
         self.canvas.set_content_font_size(size)
         
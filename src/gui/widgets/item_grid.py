@@ -107,6 +107,7 @@ class ItemGrid(QWidget):
     Refactored from FlowLayout to Free Placement.
     """
     item_clicked = pyqtSignal(str, bool)
+    item_hovered = pyqtSignal(str, bool) # name, entered
 
     def __init__(self, data_dict, images_dir, widget_id, layout_manager, icon_size=40, show_labels=False, parent=None):
         super().__init__(parent)
@@ -153,6 +154,7 @@ class ItemGrid(QWidget):
             icon.show() # Explicitly show since not in layout
             
             icon.toggled.connect(self._on_item_toggled)
+            icon.hovered.connect(self.item_hovered)
             icon.position_changed.connect(self._on_item_moved)
             
             self.icons[name] = icon
@@ -208,6 +210,13 @@ class ItemGrid(QWidget):
         if name in self.icons:
             self.icons[name].set_active(state)
 
+    def apply_delta(self, delta):
+        """Updates only the icons whose item was added/removed in a StateManager delta."""
+        for name in delta.items_added:
+            self.set_item_state(name, True)
+        for name in delta.items_removed:
+            self.set_item_state(name, False)
+
     def set_content_font_size(self, size):
         for icon in self.icons.values():
             icon.set_font_size(size)
@@ -9,6 +9,7 @@ class ItemIcon(QWidget):
     - Supports optional text label.
     """
     toggled = pyqtSignal(str, bool) # name, new_state
+    hovered = pyqtSignal(str, bool) # name, entered
 
     def __init__(self, name, image_path, size=48, show_label=False, parent=None):
         super().__init__(parent)
@@ -72,6 +73,14 @@ class ItemIcon(QWidget):
         else:
             super().mousePressEvent(event)
 
+    def enterEvent(self, event):
+        self.hovered.emit(self.name, True)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.hovered.emit(self.name, False)
+        super().leaveEvent(event)
+
     def _update_display(self):
         # Apply Opacity & Styling
         from PyQt6.QtWidgets import QGraphicsOpacityEffect
@@ -65,9 +65,9 @@ class ItemsWidget(QWidget):
         super().__init__(parent)
         self.state_manager = state_manager
         
-        # Data storage
-        # entry = {'location': str, 'name': str, 'category': str}
-        self.entries = [] 
+        # Display order of (location, item_name) (dict keys: O(1) removal) and their row widgets
+        self.entries = {}
+        self.rows = {}
         
         self.init_ui()
         self.connect_signals()
@@ -127,24 +127,22 @@ class ItemsWidget(QWidget):
         self.btn_add.clicked.connect(lambda: self.add_requested.emit())
         self.btn_sort_loc.clicked.connect(self.sort_by_location)
         self.btn_sort_item.clicked.connect(self.sort_by_item)
-        self.btn_clear.clicked.connect(self.clear_all)
+        self.btn_clear.clicked.connect(self.state_manager.clear_shop_items)
 
     def connect_signals(self):
-        # We need a signal from StateManager when an item is added via search
-        # Currently StateManager treats inventory as a dict {name: bool}.
-        # But this "Shop Items" list works differently?
-        # In v1.3 "Item/Spells" are added to a text list.
-        # This list IS the "inventory" for shop items.
-        pass
+        # StateManager owns the shop entries; this widget only mirrors them.
+        # Single adds/removes update one row, whole-list changes (load/reset) rebuild.
+        self.state_manager.shop_item_added.connect(self._add_row)
+        self.state_manager.shop_item_removed.connect(self._remove_row)
+        self.state_manager.shop_items_changed.connect(lambda _: self.refresh_from_state())
 
     def add_item(self, location, item_name):
         """Adds a new item entry."""
-        # Use StateManager as source of truth
+        # Use StateManager as source of truth (signal adds the row)
         self.state_manager.register_shop_item(location, item_name)
-        # self.refresh_list() # Signal will trigger refresh
         
     def refresh_from_state(self):
-        self.entries = self.state_manager.shop_items
+        self.entries = dict.fromkeys(self.state_manager.shop_store)
         self.refresh_list()
         
     def refresh_list(self):
@@ -153,48 +151,50 @@ class ItemsWidget(QWidget):
             child = self.list_layout.takeAt(0)
             if child.widget():
                 child.widget().deleteLater()
+        self.rows = {}
                 
         # Rebuild
+        for location, item_name in self.entries:
+            self._add_row(location, item_name, track=False)
+
+    def _add_row(self, location, item_name, track=True):
+        key = (location, item_name)
+        if key in self.rows:
+            return
         font_size = getattr(self, 'current_font_size', 11)
-        for entry in self.entries:
-            row = AddedItemEntry(entry['location'], entry['name'], font_size=font_size)
-            row.remove_requested.connect(self.remove_item)
-            self.list_layout.addWidget(row)
+        row = AddedItemEntry(location, item_name, font_size=font_size)
+        row.remove_requested.connect(self.remove_item)
+        self.list_layout.addWidget(row)
+        self.rows[key] = row
+        if track:
+            self.entries[key] = None
+
+    def _remove_row(self, location, item_name):
+        row = self.rows.pop((location, item_name), None)
+        if row:
+            self.list_layout.removeWidget(row)
+            row.deleteLater()
+            del self.entries[(location, item_name)]
             
     def remove_item(self, location, item_name):
-        self.entries = [e for e in self.entries if not (e['name'] == item_name and e['location'] == location)]
-        self.refresh_list()
+        self.state_manager.unregister_shop_item(location, item_name)
+
+    def _reorder(self, keys):
+        """Re-inserts the existing row widgets in the given order (no rebuild)."""
+        self.entries = dict.fromkeys(keys)
+        for key in self.entries:
+            row = self.rows[key]
+            self.list_layout.removeWidget(row)
+            self.list_layout.addWidget(row)
         
     def sort_by_location(self):
-        self.entries.sort(key=lambda x: x['location'])
-        self.refresh_list()
+        self._reorder(self.state_manager.shop_store.sorted_by_location())
         
     def sort_by_item(self):
-        self.entries.sort(key=lambda x: x['name'])
-        self.refresh_list()
+        self._reorder(self.state_manager.shop_store.sorted_by_item())
         
-    def clear_all(self):
-        self.entries.clear()
-        self.refresh_list()
-
     def set_content_font_size(self, size):
         self.current_font_size = size
         # Update existing
-        for i in range(self.list_layout.count()):
-            widget = self.list_layout.itemAt(i).widget()
-            if isinstance(widget, AddedItemEntry):
-                widget.update_font_size(size)
-                
-    def refresh_list(self):
-        # Clear layout
-        while self.list_layout.count():
-            child = self.list_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-                
-        # Rebuild
-        font_size = getattr(self, 'current_font_size', 11)
-        for entry in self.entries:
-            row = AddedItemEntry(entry['location'], entry['name'], font_size=font_size)
-            row.remove_requested.connect(self.remove_item)
-            self.list_layout.addWidget(row)
+        for row in self.rows.values():
+            row.update_font_size(size)
@@ -149,17 +149,11 @@ class MaidenWidget(QWidget):
     def update_icon(self, label, name, active):
         # Reuse character images
         # Logic same as before...
-        json_file = "characters.json" # Always use colored path base
-        # Logic in previous code: used active/bw json separately.
+        # Colored images when active, black-and-white otherwise
+        characters = self.data_loader.get_character_models(black_and_white=not active)
         
-        if active:
-             data = self.data_loader.load_json("characters.json")
-        else:
-             data = self.data_loader.load_json("characters_bw.json")
-        
-        if name in data:
-            rel_path = data[name]["image_path"]
-            full_path = self.data_loader.resolve_image_path(rel_path)
+        if name in characters:
+            full_path = self.data_loader.resolve_image_path(characters[name].image_path)
             label.setPixmap(QPixmap(full_path))
         else:
             label.setText(name[0])
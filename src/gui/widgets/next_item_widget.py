@@ -0,0 +1,54 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem
+from PyQt6.QtCore import Qt
+
+class NextItemWidget(QWidget):
+    """
+    Ranks every unobtained tool / key by how many locations it would open right now.
+    Reads the LogicEngine's tracked inventory, so refresh() must run after the
+    engine has been updated (MainWindow takes care of that).
+    """
+
+    def __init__(self, data_loader, state_manager, logic_engine, parent=None):
+        super().__init__(parent)
+        self.state_manager = state_manager
+        self.logic_engine = logic_engine
+
+        # Same item pool as the Tools / Keys docks
+        tools = data_loader.load_json("tool_items.json")
+        keys = data_loader.load_json("scenario_items.json")
+        self.candidates = list(tools.keys()) + [k for k in keys.keys() if k not in ["Door key", "Shrine"]]
+
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+        self.label = QLabel("New locations per item:")
+        layout.addWidget(self.label)
+
+        self.list_widget = QListWidget()
+        self.list_widget.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.list_widget.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        layout.addWidget(self.list_widget)
+
+    def refresh(self):
+        inventory = self.state_manager.inventory
+        ranking = self.logic_engine.rank_next_items(
+            [name for name in self.candidates if not inventory.get(name, False)]
+        )
+
+        self.list_widget.clear()
+        for name, unlocks in ranking:
+            item = QListWidgetItem(f"{name}: +{len(unlocks)}")
+            if not unlocks:
+                item.setForeground(Qt.GlobalColor.gray)
+            else:
+                item.setToolTip(", ".join(sorted(unlocks)))
+            self.list_widget.addItem(item)
+
+    def set_content_font_size(self, size):
+        font = self.list_widget.font()
+        font.setPixelSize(size)
+        self.list_widget.setFont(font)
@@ -1,15 +1,31 @@
 import sys
+import argparse
 import logging
 from PyQt6.QtWidgets import QApplication
 from gui.main_window import MainWindow
+from gui.qt_state import QtStateManager
 from core.data_loader import DataLoader
 from core.logic_engine import LogicEngine
 from core.state_manager import StateManager
+from core.persistence import AutosaveJournal
+from core.session_host import SessionHost
+from utils.constants import AUTOSAVE_DIR
 
 # Setup basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Lufia 2 Manual Tracker")
+    parser.add_argument(
+        "--sessions", nargs="+", metavar="NAME",
+        help="Track several independent sessions side by side (e.g. racers of one seed)"
+    )
+    # Qt consumes its own options from the remaining arguments
+    args, _ = parser.parse_known_args(argv[1:])
+    return args
+
 def main():
+    args = parse_args(sys.argv)
     app = QApplication(sys.argv)
     app.setApplicationName("Lufia 2 Manual Tracker")
     app.setStyle("Fusion")
@@ -95,12 +111,27 @@ def main():
     # Core Components
     # root_dir is handled internally by utils.constants
     
+    if args.sessions:
+        # Multi-session: one shared dataset and rule set, one StateManager per name (no autosave)
+        from gui.session_window import SessionWindow
+        host = SessionHost()
+        for name in args.sessions:
+            host.add_session(name)
+        window = SessionWindow(host)
+        window.show()
+        sys.exit(app.exec())
+    
     data_loader = DataLoader() # Dark Theme Removed by request
     logic_engine = LogicEngine(data_loader)
     state_manager = StateManager(logic_engine)
     
     # GUI
-    window = MainWindow(state_manager, data_loader, logic_engine)
+    window = MainWindow(QtStateManager(state_manager), data_loader, logic_engine)
+    
+    # Crash Recovery: replay the last autosave, then keep journaling changes
+    # (snapshot writes run on the window's file worker, off the GUI thread)
+    state_manager.recover_autosave(AutosaveJournal(AUTOSAVE_DIR, executor=window.file_worker.submit))
+    
     window.show()
     
     sys.exit(app.exec())
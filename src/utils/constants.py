@@ -12,6 +12,25 @@ else:
 DATA_DIR = BASE_DIR / "src" / "data"
 IMAGES_DIR = BASE_DIR / "images"
 
+
+def _user_data_dir() -> Path:
+    """Per-user writable app directory (the install dir may be read-only)."""
+    if sys.platform == "win32":
+        root = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    elif sys.platform == "darwin":
+        root = Path.home() / "Library" / "Application Support"
+    else:
+        root = Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+    return root / "Lufia2ManualTracker"
+
+
+# Crash-recovery autosave (per-user when frozen: _MEIPASS is temporary and
+# the install dir may be read-only)
+if getattr(sys, 'frozen', False):
+    AUTOSAVE_DIR = _user_data_dir() / "autosave"
+else:
+    AUTOSAVE_DIR = BASE_DIR / "autosave"
+
 # Sacred Pixel Coordinates (Extracted from shared.py in v1.3)
 # DO NOT MODIFY THESE VALUES UNDER ANY CIRCUMSTANCES
 GAME_WORLD_SIZE = (4096, 4096)
@@ -42,3 +61,40 @@ ALWAYS_ACCESSIBLE_LOCATIONS = {
     'Darbi Shrine',
     'Cave to Sundletan'
 }
+
+# Final location of a seed (target of the spoiler solver)
+GOAL_LOCATION = "Daos' Shrine"
+
+# Max number of user actions kept for undo (and for redo)
+UNDO_LIMIT = 1000
+
+# Autosave: fsync the journal at most this often, compact into a snapshot every N records
+AUTOSAVE_SYNC_INTERVAL_MS = 1000
+AUTOSAVE_COMPACT_EVERY = 500
+
+# Hot reload: how often the loaded data files are checked for changes on disk
+DATA_RELOAD_POLL_MS = 1000
+
+# Files in DATA_DIR that the app rewrites at runtime (never preloaded, bundled or shared between sessions)
+MUTABLE_DATA_FILES = frozenset({
+    "layout_config.json",
+    "default_layout_config.json",
+    "progress_temp.json",
+})
+
+# Static data files the app reads (what DataLoader.preload loads by default)
+APP_DATA_FILES = (
+    "locations.json",
+    "locations_logic.json",
+    "location_name_mapping.json",
+    "cities.json",
+    "items_spells.json",
+    "tool_items.json",
+    "scenario_items.json",
+    "characters.json",
+    "characters_bw.json",
+    "shop_data.json",
+)
+
+# Precompiled static data (python -m core.data_bundle), stored in the data directory
+DATA_BUNDLE_NAME = "static_data.bundle"
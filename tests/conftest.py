@@ -0,0 +1,30 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# The app imports its packages from src (core, gui, utils)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.data_loader import DataLoader
+from core.logic_engine import LogicEngine
+from core.state_manager import StateManager
+
+
+@pytest.fixture(scope="session")
+def data_loader():
+    return DataLoader()
+
+
+@pytest.fixture
+def state_manager(data_loader):
+    return StateManager(LogicEngine(data_loader))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Offscreen QApplication for widget tests (skipped without PyQt6)."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
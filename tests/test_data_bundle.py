@@ -0,0 +1,65 @@
+import builtins
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from core.data_bundle import build_bundle, load_bundle, static_data_files
+from core.data_loader import DataLoader
+from utils.constants import DATA_DIR, DATA_BUNDLE_NAME
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for path in static_data_files(DATA_DIR):
+        if path.stat().st_size: # Skip empty placeholders
+            shutil.copy2(path, tmp_path / path.name)
+    build_bundle(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """Names of the files opened or read through open()/Path.read_bytes()."""
+    names = []
+    real_open, real_read_bytes = builtins.open, Path.read_bytes
+
+    def recording_open(file, *args, **kwargs):
+        names.append(Path(file).name)
+        return real_open(file, *args, **kwargs)
+
+    def recording_read_bytes(self):
+        names.append(self.name)
+        return real_read_bytes(self)
+
+    monkeypatch.setattr(builtins, "open", recording_open)
+    monkeypatch.setattr(Path, "read_bytes", recording_read_bytes)
+    return names
+
+
+def test_fresh_bundle_skips_json_reads(data_dir, opened):
+    loader = DataLoader(data_dir)
+    loader.preload()
+    assert loader.get_location_models()
+    assert loader.get_character_models()
+    assert opened == [DATA_BUNDLE_NAME]
+
+
+def test_touched_but_unchanged_files_keep_the_bundle(data_dir, opened):
+    path = data_dir / "locations.json"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_bundle(data_dir) is not None
+    assert "locations.json" in opened # Fell back to the content hash
+
+    opened.clear()
+    assert load_bundle(data_dir) is not None
+    assert opened == [DATA_BUNDLE_NAME] # Stored stats were refreshed, no second hash
+
+
+def test_edited_file_invalidates_the_bundle(data_dir):
+    path = data_dir / "cities.json"
+    path.write_text(path.read_text(encoding="utf-8") + " ", encoding="utf-8")
+    assert load_bundle(data_dir) is None
+    assert DataLoader(data_dir).get_city_models() # Served from JSON instead
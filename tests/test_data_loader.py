@@ -0,0 +1,55 @@
+import json
+import logging
+import os
+
+from core.data_loader import DataLoader
+from core.models import MODEL_PARSERS, ShopEntry
+from utils.constants import APP_DATA_FILES
+
+
+def test_preload_reads_only_the_app_files_without_errors(caplog):
+    loader = DataLoader(use_bundle=False)
+    with caplog.at_level(logging.ERROR):
+        loader.preload()
+
+    assert not caplog.records # e.g. the empty reward_flags.json is not touched
+    assert set(loader._cache) | set(loader._models) == set(APP_DATA_FILES)
+    assert not set(loader._cache) & set(MODEL_PARSERS) # Only the typed views are kept
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_bad_entry_is_skipped_and_the_rest_kept(tmp_path, caplog):
+    _write(tmp_path / "locations.json", {"Tanbel": [1, 2], "Broken": [1], "Alunze": [3, 4]})
+    loader = DataLoader(tmp_path, use_bundle=False)
+
+    locations = loader.get_location_models()
+
+    assert list(locations) == ["Tanbel", "Alunze"]
+    assert locations["Alunze"].id == 2 # Position in the file
+    assert "Broken" in caplog.text
+
+
+def test_unusable_file_is_cached_until_modified(tmp_path, caplog):
+    path = tmp_path / "cities.json"
+    path.write_text("{", encoding="utf-8")
+    loader = DataLoader(tmp_path, use_bundle=False)
+
+    assert loader.get_city_models() == {}
+    assert loader.get_city_models() == {}
+    assert caplog.text.count("cities.json") == 1 # Read and logged once
+
+    _write(path, {"Tanbel": [1, 2]})
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert loader.reload_changed() == {"cities.json"}
+    assert list(loader.get_city_models()) == ["Tanbel"]
+
+
+def test_shop_entries_are_typed(data_loader):
+    shops = data_loader.get_shop_entries()
+    entry = next(entry for entries in shops.values() for entry in entries)
+    assert isinstance(entry, ShopEntry)
+    assert isinstance(entry.code, int)
@@ -0,0 +1,65 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from core.data_loader import DataLoader
+from core.logic_engine import LogicEngine
+from core.state_manager import StateManager
+from utils.constants import APP_DATA_FILES, DATA_DIR
+
+
+@pytest.fixture
+def loader(tmp_path):
+    for filename in APP_DATA_FILES:
+        shutil.copy2(DATA_DIR / filename, tmp_path / filename)
+    return DataLoader(tmp_path, use_bundle=False).preload()
+
+
+def _edit(path, update):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    update(data)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    stat = path.stat() # Make sure the poll sees a new mtime
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_logic_edit_reloads_only_affected_locations_and_keeps_state(loader):
+    state_manager = StateManager(LogicEngine(loader))
+    state_manager.toggle_manual_inventory("Hook")
+    state_manager.set_manual_location_state("Tanbel", "cleared")
+    state_manager.logic_engine.track_inventory(state_manager.inventory) # What MapLogicSync does
+    before = state_manager.state_snapshot()
+    assert not state_manager.logic_engine.tracked_accessibility["Alunze Cave"]
+    reloads = []
+    state_manager.data_reloaded.connect(reloads.append)
+
+    _edit(loader._data_dir / "locations_logic.json",
+          lambda logic: logic["Alunze Cave"].update(access_rules=["Hook"]))
+    changed = loader.reload_changed()
+    state_manager.reload_data(changed)
+
+    assert changed == {"locations_logic.json"}
+    assert reloads[0].locations == {"Alunze Cave"}
+    assert state_manager.logic_engine.tracked_accessibility["Alunze Cave"]
+    assert state_manager.logic_engine.calculate_accessibility({"Hook": True})["Alunze Cave"] # Memo dropped
+    assert state_manager.state_snapshot() == before
+    assert loader.reload_changed() == frozenset() # Nothing new on the next poll
+
+
+def test_half_written_file_keeps_the_previous_data(loader):
+    path = loader._data_dir / "cities.json"
+    cities = dict(loader.get_city_models())
+    path.write_text('{"Tanbel": [1,', encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert loader.reload_changed() == frozenset()
+    assert loader.get_city_models() == cities
+
+    path.write_text(json.dumps({"Tanbel": [1, 2]}), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    assert loader.reload_changed() == {"cities.json"}
+    assert list(loader.get_city_models()) == ["Tanbel"]
@@ -0,0 +1,25 @@
+import io
+import json
+
+from core import logic_cli
+
+
+def _run(monkeypatch, *lines):
+    stdin = io.StringIO("".join(json.dumps(line) + "\n" for line in lines))
+    stdout = io.StringIO()
+    monkeypatch.setattr("sys.stdin", stdin)
+    monkeypatch.setattr("sys.stdout", stdout)
+    logic_cli.main(["--deltas"])
+    return [json.loads(line) for line in stdout.getvalue().splitlines()][1:] # Without the baseline
+
+
+def test_obtained_must_be_a_boolean(monkeypatch):
+    results = _run(
+        monkeypatch,
+        {"item": "Bomb", "obtained": "false"},
+        {"item": "Bomb", "obtained": True},
+        {"inventory": {"Bomb": 0}},
+    )
+    assert "error" in results[0]
+    assert results[1]["changed"] # A real toggle still applies
+    assert "error" in results[2]
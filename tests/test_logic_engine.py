@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from core.logic_engine import LogicEngine
+from utils.constants import ALWAYS_ACCESSIBLE_LOCATIONS
+
+
+def _classic_accessible(location, locations_logic, cities, obtained):
+    """The original string evaluation: rules are OR'ed, each "A,B" split on commas and AND'ed."""
+    if location in ALWAYS_ACCESSIBLE_LOCATIONS:
+        return True
+    logic = locations_logic.get(location)
+    if logic is None:
+        return location in cities
+    access_rules = logic.get("access_rules", [])
+    if not access_rules:
+        return True
+    return any(
+        all(item.strip() in obtained for item in rule.split(","))
+        for rule in access_rules
+    )
+
+
+def _random_inventories(items, count, seed=2024):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield {item: rng.random() < 0.5 for item in rng.sample(items, rng.randint(0, len(items)))}
+
+
+def test_compiled_rules_match_the_classic_string_evaluation(data_loader):
+    engine = LogicEngine(data_loader)
+    locations_logic = data_loader.get_locations_logic()
+    cities = data_loader.get_city_models()
+    items = sorted({
+        item.strip()
+        for logic in locations_logic.values()
+        for rule in logic.get("access_rules", [])
+        for item in rule.split(",")
+    }) + ["Not In Any Rule"]
+    locations = set(locations_logic) | set(cities)
+
+    for inventory in _random_inventories(items, 3000):
+        obtained = {item for item, flag in inventory.items() if flag}
+        expected = {
+            location: _classic_accessible(location, locations_logic, cities, obtained)
+            for location in locations
+        }
+        assert engine.calculate_accessibility(inventory) == expected, sorted(obtained)
+
+
+def test_batch_matches_single_evaluation(data_loader):
+    np = pytest.importorskip("numpy")
+    engine = LogicEngine(data_loader)
+    items = list(engine.item_names)
+    inventories = list(_random_inventories(items, 500, seed=7))
+    matrix = np.array([[inventory.get(item, False) for item in items] for inventory in inventories])
+
+    result = engine.calculate_accessibility_batch(matrix)
+
+    for row, inventory in zip(result, inventories):
+        single = engine.calculate_accessibility(inventory)
+        assert dict(zip(engine.location_names, row.tolist())) == single
+
+
+def test_batch_chunks_follow_the_element_budget(data_loader):
+    np = pytest.importorskip("numpy")
+    engine = LogicEngine(data_loader)
+    items = list(engine.item_names)
+    matrix = np.array([
+        [inventory.get(item, False) for item in items]
+        for inventory in _random_inventories(items, 300, seed=11)
+    ])
+    expected = engine.calculate_accessibility_batch(matrix)
+
+    engine.BATCH_CHUNK_ELEMENTS = 1000 # A few rows per chunk
+    assert (engine.calculate_accessibility_batch(matrix) == expected).all()
+    engine.BATCH_CHUNK_ELEMENTS = 1 # Never below one row
+    assert (engine.calculate_accessibility_batch(matrix) == expected).all()
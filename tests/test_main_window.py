@@ -0,0 +1,26 @@
+def test_unlock_preview_follows_inventory_changes_while_hovered(qapp, data_loader):
+    from core.logic_engine import LogicEngine
+    from core.state_manager import StateManager
+    from gui.main_window import MainWindow
+    from gui.qt_state import QtStateManager
+
+    logic_engine = LogicEngine(data_loader)
+    state_manager = QtStateManager(StateManager(logic_engine))
+    window = MainWindow(state_manager, data_loader, logic_engine)
+    rings = window.map_widget._preview_rings
+
+    def ringed():
+        return {name for name, ring in rings.items() if ring.isVisible()}
+
+    window._on_item_hovered("Bomb", True)
+    unlocked = ringed()
+    assert unlocked
+
+    state_manager.toggle_manual_inventory("Bomb") # Obtained: nothing left to preview
+    assert not ringed()
+    state_manager.undo()
+    assert ringed() == unlocked
+
+    window._on_item_hovered("Bomb", False)
+    assert not ringed()
+    window.close()
@@ -0,0 +1,104 @@
+from core.logic_engine import LogicEngine
+from core.persistence import AutosaveJournal
+from core.state_manager import StateManager
+
+
+class QueuedExecutor:
+    """Collects snapshot writes instead of running them (a busy background thread)."""
+
+    def __init__(self):
+        self.tasks = []
+
+    def __call__(self, func, *args):
+        self.tasks.append((func, args))
+
+    def run_all(self):
+        for func, args in self.tasks:
+            func(*args)
+        self.tasks.clear()
+
+
+def _recovered(data_loader, directory):
+    state_manager = StateManager(LogicEngine(data_loader))
+    state_manager.recover_autosave(AutosaveJournal(directory))
+    return state_manager.state_snapshot()
+
+
+def test_compaction_waits_for_sync_and_runs_on_the_executor(tmp_path, state_manager, data_loader):
+    executor = QueuedExecutor()
+    state_manager.recover_autosave(AutosaveJournal(tmp_path, compact_every=3, executor=executor))
+    executor.run_all()
+
+    for item in ("Bomb", "Hook", "Hammer", "Arrow"):
+        state_manager.toggle_manual_inventory(item)
+    assert executor.tasks == [] # Nothing beyond the appends during user actions
+
+    state_manager.sync_autosave()
+    assert len(executor.tasks) == 1
+    executor.run_all()
+    assert _recovered(data_loader, tmp_path) == state_manager.state_snapshot()
+
+
+def test_crash_before_the_snapshot_write_loses_nothing(tmp_path, state_manager, data_loader):
+    executor = QueuedExecutor()
+    state_manager.recover_autosave(AutosaveJournal(tmp_path, compact_every=2, executor=executor))
+    executor.run_all()
+
+    state_manager.toggle_manual_inventory("Bomb")
+    state_manager.set_manual_location_state("Tanbel", "cleared")
+    state_manager.sync_autosave() # Rotates the journal, snapshot write still queued
+    state_manager.toggle_manual_inventory("Hook")
+    state_manager.sync_autosave()
+
+    assert executor.tasks # Never written: simulated crash
+    assert _recovered(data_loader, tmp_path) == state_manager.state_snapshot()
+
+
+def test_spoiler_placements_survive_save_and_autosave(tmp_path, state_manager, data_loader):
+    state_manager.recover_autosave(AutosaveJournal(tmp_path))
+    state_manager.register_spoiler_location("Tanbel", "Dekar")
+    state_manager.sync_autosave()
+
+    restored = StateManager(LogicEngine(data_loader))
+    restored.restore_state(state_manager.state_snapshot())
+    assert restored.state_snapshot()["spoiler_placements"] == {"Tanbel": "Dekar"}
+
+    recovered = StateManager(LogicEngine(data_loader))
+    recovered.recover_autosave(AutosaveJournal(tmp_path)) # From the journal tail
+    assert recovered.state_snapshot()["spoiler_placements"] == {"Tanbel": "Dekar"}
+
+
+def test_unwritable_autosave_dir_leaves_autosave_off(tmp_path, state_manager, caplog):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    state_manager.recover_autosave(AutosaveJournal(blocker / "autosave"))
+
+    state_manager.toggle_manual_inventory("Bomb") # No crash, nothing journaled
+    state_manager.sync_autosave()
+    state_manager.close_autosave()
+    assert state_manager.inventory.get("Bomb")
+    assert "autosave is off" in caplog.text
+
+
+class FailingFile:
+    """Journal file on a full disk."""
+
+    def write(self, data):
+        raise OSError(28, "No space left on device")
+
+    def close(self):
+        pass
+
+
+def test_write_errors_turn_autosave_off_once(tmp_path, state_manager, caplog):
+    journal = AutosaveJournal(tmp_path)
+    state_manager.recover_autosave(journal)
+    journal._file = FailingFile()
+
+    state_manager.toggle_manual_inventory("Bomb")
+    state_manager.toggle_manual_inventory("Hook")
+    state_manager.sync_autosave()
+    state_manager.close_autosave()
+
+    assert not journal.enabled
+    assert caplog.text.count("autosave is off") == 1
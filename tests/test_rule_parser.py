@@ -0,0 +1,92 @@
+from itertools import product
+
+import pytest
+
+from core.rule_parser import (
+    ALWAYS, RuleSyntaxError, compile_rule, evaluate_columns, parse_rule, rule_items, to_masks
+)
+
+ITEMS = ("Claire", "Lisa", "Marie", "Bomb", "Hook")
+BITS = {name: 1 << index for index, name in enumerate(ITEMS)}
+
+
+def _inventories():
+    """Every subset of ITEMS as (mask, set of names)."""
+    for flags in product((False, True), repeat=len(ITEMS)):
+        names = {name for name, flag in zip(ITEMS, flags) if flag}
+        yield sum(BITS[name] for name in names), names
+
+
+@pytest.mark.parametrize("rule, expected", [
+    ("Bomb,,Hook", ("and", (("item", "Bomb"), ("item", ""), ("item", "Hook")))),
+    ("Bomb,", ("and", (("item", "Bomb"), ("item", "")))),
+    ("", ("item", "")),
+])
+def test_empty_items_between_commas_keep_the_classic_meaning(rule, expected):
+    assert parse_rule(rule) == expected
+
+
+@pytest.mark.parametrize("rule", ["Bomb &", "Bomb |", "&Bomb", "(Bomb &)", "2 of [Bomb, Hook,]", "Bomb &, Hook", "!"])
+def test_dangling_operators_are_syntax_errors(rule):
+    with pytest.raises(RuleSyntaxError):
+        parse_rule(rule)
+
+
+def test_empty_item_list_is_always_accessible():
+    node = parse_rule([])
+    assert node == ALWAYS
+    assert to_masks(node, lambda item: 1) == (0,)
+    assert compile_rule(node, lambda item: 1)(0)
+
+
+@pytest.mark.parametrize("rule, holds", [
+    ("Bomb & (Hook | Lisa)", lambda have: "Bomb" in have and ("Hook" in have or "Lisa" in have)),
+    ("Bomb,Hook | Lisa", lambda have: {"Bomb", "Hook"} <= have or "Lisa" in have),
+    ("!Bomb & Hook", lambda have: "Bomb" not in have and "Hook" in have),
+    ("!(Bomb | Hook)", lambda have: not have & {"Bomb", "Hook"}),
+    ("2 of [Claire, Lisa, Marie]", lambda have: len(have & {"Claire", "Lisa", "Marie"}) >= 2),
+    ("2 of [Claire, Claire, Lisa]", lambda have: "Claire" in have or {"Claire", "Lisa"} <= have),
+    ("2 of [Claire & Bomb, Lisa | Hook, !Marie]",
+     lambda have: sum(({"Claire", "Bomb"} <= have, bool(have & {"Lisa", "Hook"}), "Marie" not in have)) >= 2),
+    ("Hook & 1 of [Claire, Lisa]", lambda have: "Hook" in have and bool(have & {"Claire", "Lisa"})),
+])
+def test_closure_matches_the_rule_meaning(rule, holds):
+    program = compile_rule(parse_rule(rule), BITS.__getitem__)
+    for mask, names in _inventories():
+        assert program(mask) == holds(names), (rule, names)
+
+
+@pytest.mark.parametrize("rule", [
+    "Bomb & (Hook | Lisa)",
+    "2 of [Claire, Lisa, Marie]",
+    "2 of [Claire, Claire, Lisa]",
+    "Hook & 2 of [Claire | Bomb, Lisa, Marie & Hook]",
+    "Bomb,,Hook",
+])
+def test_masks_and_closure_agree(rule):
+    node = parse_rule(rule)
+    bits = dict(BITS, **{"": 1 << len(ITEMS)}) # "" is an item nobody owns
+    program = compile_rule(node, bits.__getitem__)
+    masks = to_masks(node, bits.__getitem__)
+    assert masks is not None
+    for mask, _ in _inventories():
+        assert any(mask & m == m for m in masks) == program(mask), rule
+
+
+@pytest.mark.parametrize("rule", [
+    "Bomb & (Hook | Lisa)",
+    "!Bomb & Hook",
+    "2 of [Claire, Claire, Lisa]",
+    "2 of [Claire & Bomb, Lisa | Hook, !Marie]",
+])
+def test_columns_and_closure_agree(rule):
+    np = pytest.importorskip("numpy")
+    node = parse_rule(rule)
+    program = compile_rule(node, BITS.__getitem__)
+    inventories = list(_inventories())
+    columns = {
+        name: np.array([bool(mask & BITS[name]) for mask, _ in inventories])
+        for name in rule_items(node)
+    }
+    result = evaluate_columns(node, columns.__getitem__)
+    assert list(result) == [program(mask) for mask, _ in inventories]
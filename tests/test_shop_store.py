@@ -0,0 +1,48 @@
+from core.shop_store import ShopStore
+
+
+def _store():
+    return ShopStore([("Tanbel", "Potion"), ("Alunze", "Bomb"), ("Alunze", "Potion"), ("Tanbel", "Ether")])
+
+
+def test_insertion_order_and_duplicates():
+    store = _store()
+    assert not store.add("Tanbel", "Potion")
+    assert list(store) == [("Tanbel", "Potion"), ("Alunze", "Bomb"), ("Alunze", "Potion"), ("Tanbel", "Ether")]
+    assert ShopStore.from_list(store.to_list()).to_list() == store.to_list()
+
+
+def test_indexes_follow_removals():
+    store = _store()
+    assert store.remove("Alunze", "Potion")
+    assert not store.remove("Alunze", "Potion")
+
+    assert ("Alunze", "Potion") not in store
+    assert store.items_at("Alunze") == ("Bomb",)
+    assert store.locations_of("Potion") == ("Tanbel",)
+    store.remove("Alunze", "Bomb")
+    assert store.items_at("Alunze") == ()
+    assert store.sorted_by_location() == [("Tanbel", "Potion"), ("Tanbel", "Ether")]
+
+
+def test_sorted_views():
+    store = _store()
+    assert store.sorted_by_location() == [
+        ("Alunze", "Bomb"), ("Alunze", "Potion"), ("Tanbel", "Potion"), ("Tanbel", "Ether"),
+    ]
+    assert store.sorted_by_item() == [
+        ("Alunze", "Bomb"), ("Tanbel", "Ether"), ("Tanbel", "Potion"), ("Alunze", "Potion"),
+    ]
+
+
+def test_state_manager_shop_signals(state_manager):
+    events = []
+    state_manager.shop_item_added.connect(lambda *args: events.append(("added",) + args))
+    state_manager.shop_item_removed.connect(lambda *args: events.append(("removed",) + args))
+
+    state_manager.register_shop_item("Tanbel", "Potion")
+    state_manager.register_shop_item("Tanbel", "Potion") # Duplicate: no signal
+    state_manager.unregister_shop_item("Tanbel", "Potion")
+
+    assert events == [("added", "Tanbel", "Potion"), ("removed", "Tanbel", "Potion")]
+    assert state_manager.shop_items == []
@@ -0,0 +1,191 @@
+import pytest
+
+
+def test_reset_overrides_reemits_dropped_location_overrides(state_manager):
+    deltas = []
+    state_manager.state_delta.connect(deltas.append)
+    state_manager.set_manual_location_state("Dankirk Kingdom", "cleared")
+
+    state_manager.reset_overrides()
+
+    assert "Dankirk Kingdom" not in state_manager.locations
+    assert deltas[-1].locations == {"Dankirk Kingdom": ""}
+
+
+def test_reset_overrides_repaints_the_map_dot(qapp, data_loader):
+    from core.logic_engine import LogicEngine
+    from core.state_manager import StateManager
+    from gui.map_sync import MapLogicSync
+    from gui.map_widget import MapWidget
+    from gui.qt_state import QtStateManager
+
+    state_manager = QtStateManager(StateManager(LogicEngine(data_loader)))
+    map_widget = MapWidget(data_loader)
+    sync = MapLogicSync(map_widget, state_manager, state_manager.logic_engine, data_loader)
+    sync.refresh_all()
+    dot = map_widget._dots["Dankirk Kingdom"]
+    initial = dot._color_name
+
+    state_manager.set_manual_location_state("Dankirk Kingdom", "cleared")
+    assert dot._color_name == "cleared"
+    state_manager.reset_overrides()
+
+    assert dot._color_name == initial == "city"
+
+
+def test_restore_state_rebuilds_characters_and_map_once(qapp, data_loader, monkeypatch):
+    from collections import Counter
+    from core.layout_manager import LayoutManager
+    from core.logic_engine import LogicEngine
+    from core.state_manager import StateManager
+    from gui.map_sync import MapLogicSync
+    from gui.map_widget import MapWidget
+    from gui.qt_state import QtStateManager
+    from gui.widgets.characters_widget import CharactersWidget
+
+    source = StateManager(LogicEngine(data_loader))
+    locations = sorted(data_loader.get_location_models())
+    for location, name in zip(locations, sorted(data_loader.get_character_models())[:4]):
+        source.assign_character_to_location(location, name)
+    source.toggle_manual_inventory("Hook")
+    snapshot = source.state_snapshot()
+
+    state_manager = QtStateManager(StateManager(LogicEngine(data_loader)))
+    characters = CharactersWidget(data_loader, state_manager, LayoutManager())
+    map_widget = MapWidget(data_loader)
+    sync = MapLogicSync(map_widget, state_manager, state_manager.logic_engine, data_loader)
+    sync.refresh_all()
+
+    rebuilds = []
+    monkeypatch.setattr(characters.canvas, "refresh_state", lambda: rebuilds.append(1))
+    painted = Counter()
+    monkeypatch.setattr(map_widget, "update_dot_color", lambda name, color: painted.update([name]))
+
+    state_manager.restore_state(snapshot)
+
+    assert len(rebuilds) == 1
+    assert painted and set(painted.values()) == {1}
+
+
+@pytest.mark.parametrize("action", [
+    lambda sm: sm.toggle_manual_inventory("Bomb"),
+    lambda sm: sm.set_manual_location_state("Alunze Cave", "cleared"),
+    lambda sm: sm.set_character_status("Dekar", obtained=True, active=True),
+    lambda sm: sm.assign_character_to_location("Tanbel", "Guy"),
+    lambda sm: sm.register_shop_item("Tanbel", "Potion"),
+    lambda sm: sm.clear_shop_items(),
+])
+def test_undo_redo_round_trip(state_manager, action):
+    state_manager.register_shop_item("Alunze", "Bomb")
+    state_manager.assign_character_to_location("Tanbel", "Dekar")
+    before = state_manager.state_snapshot()
+
+    action(state_manager)
+    after = state_manager.state_snapshot()
+    assert after != before
+
+    assert state_manager.undo()
+    assert state_manager.state_snapshot() == before
+    assert state_manager.redo()
+    assert state_manager.state_snapshot() == after
+
+
+def test_actions_inside_a_batch_stay_separate_undo_steps(state_manager):
+    with state_manager.batch():
+        state_manager.toggle_manual_inventory("Bomb")
+        state_manager.toggle_manual_inventory("Hook")
+
+    state_manager.undo()
+    assert dict(state_manager.inventory) == {"Bomb": True}
+
+
+def test_new_action_clears_the_redo_stack(state_manager):
+    state_manager.toggle_manual_inventory("Bomb")
+    state_manager.undo()
+    assert state_manager.can_redo()
+
+    state_manager.toggle_manual_inventory("Hook")
+    assert not state_manager.can_redo()
+    assert not state_manager.redo()
+
+
+@pytest.mark.parametrize("reset", ["reset_state", "reset_overrides"])
+def test_resets_drop_the_history(state_manager, reset):
+    state_manager.toggle_manual_inventory("Bomb")
+    getattr(state_manager, reset)()
+    assert not state_manager.can_undo()
+    assert not state_manager.undo()
+
+
+def test_history_depth_is_bounded(state_manager):
+    from core.undo_journal import UndoJournal
+
+    state_manager._journal = UndoJournal(limit=3)
+    for item in ("Bomb", "Hook", "Jade", "Engine", "Hammer"):
+        state_manager.toggle_manual_inventory(item)
+
+    undone = 0
+    while state_manager.undo():
+        undone += 1
+    assert undone == 3
+    assert dict(state_manager.inventory) == {"Bomb": True, "Hook": True} # Oldest steps fell off
+
+
+def _assert_character_index_consistent(state_manager):
+    forward = state_manager._character_locations
+    reverse = state_manager._location_of_character
+    assert reverse == {name: location for location, name in forward.items()}
+    for location, name in forward.items():
+        assert state_manager.get_character_at_location(location) == name
+        assert state_manager.get_location_of_character(name) == location
+        assert state_manager.is_character_assigned(name)
+
+
+def test_character_index_after_reassignment(state_manager):
+    state_manager.assign_character_to_location("Tanbel", "Dekar")
+    state_manager.assign_character_to_location("Alunze Cave", "Dekar") # Move
+    state_manager.assign_character_to_location("Alunze Cave", "Guy")   # Overwrite
+    _assert_character_index_consistent(state_manager)
+    assert not state_manager.is_character_assigned("Dekar")
+    assert state_manager.get_character_at_location("Tanbel") is None
+
+    state_manager.undo()
+    _assert_character_index_consistent(state_manager)
+    assert state_manager.get_location_of_character("Dekar") == "Alunze Cave"
+
+    state_manager.remove_character_assignment("Alunze Cave")
+    _assert_character_index_consistent(state_manager)
+    assert state_manager._character_locations == {}
+
+
+def test_character_index_after_spoiler_registration_and_restore(state_manager):
+    state_manager.register_spoiler_location("Tanbel", "Dekar")
+    state_manager.register_spoiler_location("Tanbel", "Guy") # Spoiler entry replaced
+    _assert_character_index_consistent(state_manager)
+    assert not state_manager.is_character_assigned("Dekar")
+
+    snapshot = state_manager.state_snapshot()
+    state_manager.reset_state()
+    _assert_character_index_consistent(state_manager)
+    state_manager.restore_state(snapshot)
+    _assert_character_index_consistent(state_manager)
+    assert state_manager.get_location_of_character("Guy") == "Tanbel"
+
+
+def test_spoiler_names_normalize_like_the_linear_scan(state_manager, data_loader):
+    mapping = data_loader.get_location_name_mapping()
+
+    def linear_scan(raw):
+        for internal_name, spoiler_name in mapping.items():
+            if spoiler_name == raw:
+                return internal_name
+        return raw
+
+    for spoiler_name in mapping.values():
+        assert state_manager._normalize_location_name(spoiler_name) == linear_scan(spoiler_name)
+        # Fuzzy fallback: case, punctuation and whitespace do not matter
+        fuzzy = spoiler_name.upper().replace(" ", "  ") + "."
+        assert state_manager._normalize_location_name(fuzzy) == linear_scan(spoiler_name)
+
+    assert state_manager._normalize_location_name("Nowhere At All") == "Nowhere At All"
+    assert state_manager._normalize_location_name("") == "Unknown"